@@ -1,104 +1,385 @@
+import atexit
 import os
+import shutil
 import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows 下没有 fcntl，仅支持单进程运行（开发模式）
+    fcntl = None
 
 # 添加 api 目录到路径
 api_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, api_dir)
 
 import yaml
-from flask import Flask, send_from_directory, jsonify, request
+from flask import Flask, Response, send_from_directory, jsonify, request
 from flask_cors import CORS
 
 from crypto_utils import crypto_manager
-from k8s_client_svc import K8sClientSvc
+from fanout import FanOutExecutor, DEFAULT_TIMEOUT
+from k8s_client_svc import K8sClientSvc, cached_yaml_dump
+from k8s_rows import ParamError
+from log_stream import LOG_HEARTBEAT_INTERVAL, gzip_chunks, prefetch, sse_events, sse_lines
+from ssh_client import StreamLimitError, jump_transports
 
 app = Flask(__name__, static_folder=None)
 CORS(app)  # 启用 CORS 支持
 
 # 配置文件路径
 CLUSTERS_CONFIG_FILE = '.clusters.yaml'
+# 多进程写配置文件时使用的文件锁
+CLUSTERS_LOCK_FILE = CLUSTERS_CONFIG_FILE + '.lock'
+# 后台检查配置文件变化的间隔（秒），0 表示关闭后台检查；
+# 无论是否开启，每个 API 请求处理前都会检查一次，保证多个 worker 看到一致的集群配置
+CLUSTERS_RELOAD_INTERVAL = float(os.environ.get('CLUSTERS_RELOAD_INTERVAL', 2))
+
+
+def config_file_stat():
+    """配置文件指纹 (mtime, 大小, inode)，文件不存在时返回 None；原子写入每次替换为新文件，inode 随之变化"""
+    try:
+        st = os.stat(CLUSTERS_CONFIG_FILE)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def read_clusters_file():
+    """读取并解密集群配置，文件内容无效时抛出异常"""
+    with open(CLUSTERS_CONFIG_FILE, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    clusters_data = config.get('clusters') or {}
+
+    # 解密SSH配置
+    for cluster_name, cluster_info in clusters_data.items():
+        if 'ssh_config' in cluster_info:
+            cluster_info['ssh_config'] = crypto_manager.decrypt_ssh_config(
+                cluster_info['ssh_config'], (cluster_name,)
+            )
+
+    return clusters_data
 
 
 def load_clusters():
     """从YAML文件加载集群配置"""
     if os.path.exists(CLUSTERS_CONFIG_FILE):
         try:
-            with open(CLUSTERS_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                clusters_data = config.get('clusters', {})
-
-                # 解密SSH配置
-                for cluster_name, cluster_info in clusters_data.items():
-                    if 'ssh_config' in cluster_info:
-                        cluster_info['ssh_config'] = crypto_manager.decrypt_ssh_config(
-                            cluster_info['ssh_config']
-                        )
-
-                return clusters_data
+            return read_clusters_file()
         except Exception as e:
             print(f"加载集群配置文件失败: {e}")
             return {}
     return {}
 
 
-def save_clusters(clusters_data):
-    """保存集群配置到YAML文件"""
-    try:
-        # 深拷贝，避免修改原始数据
-        encrypted_clusters = {}
+def _write_fsync(f, text):
+    f.write(text)
+    f.flush()
+    os.fsync(f.fileno())
 
-        for cluster_name, cluster_info in clusters_data.items():
-            encrypted_cluster = cluster_info.copy()
 
-            # 加密SSH配置
-            if 'ssh_config' in encrypted_cluster:
-                encrypted_cluster['ssh_config'] = crypto_manager.encrypt_ssh_config(
-                    encrypted_cluster['ssh_config']
-                )
+def write_file_atomic(path, text):
+    """
+    原子写入：先写入同目录下的临时文件并 fsync，再 rename 覆盖原文件，
+    写入过程中崩溃不会留下不完整的配置文件
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.clusters-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            _write_fsync(f, text)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # 单文件挂载（如 docker volume 挂载 .clusters.yaml）无法 rename 覆盖，退回为原地写入
+            with open(path, 'w', encoding='utf-8') as f:
+                _write_fsync(f, text)
+            return
+        if hasattr(os, 'O_DIRECTORY'):
+            # 确保 rename 本身已落盘
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
-            encrypted_clusters[cluster_name] = encrypted_cluster
 
-        # 保存到文件
-        with open(CLUSTERS_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            yaml.dump({'clusters': encrypted_clusters}, f, allow_unicode=True, default_flow_style=False)
+def save_clusters(clusters_data):
+    """保存集群配置到YAML文件"""
+    global clusters_file_stat, clusters_file_text
+    try:
+        with clusters_lock:
+            # 深拷贝，避免修改原始数据
+            encrypted_clusters = {}
+
+            for cluster_name, cluster_info in clusters_data.items():
+                encrypted_cluster = cluster_info.copy()
+
+                # 加密SSH配置，未变化的密码复用原密文
+                if 'ssh_config' in encrypted_cluster:
+                    encrypted_cluster['ssh_config'] = crypto_manager.encrypt_ssh_config(
+                        encrypted_cluster['ssh_config'], (cluster_name,)
+                    )
+
+                encrypted_clusters[cluster_name] = encrypted_cluster
+
+            text = yaml.dump({'clusters': encrypted_clusters}, allow_unicode=True, default_flow_style=False)
+            if text == clusters_file_text and config_file_stat() == clusters_file_stat:
+                # 内容未变化且文件未被外部修改
+                return True
+
+            # 保存到文件
+            write_file_atomic(CLUSTERS_CONFIG_FILE, text)
+            # 记录自身写入后的指纹，文件监视不会重复加载
+            clusters_file_stat = config_file_stat()
+            clusters_file_text = text
         return True
     except Exception as e:
         print(f"保存集群配置文件失败: {e}")
         return False
 
 
+# 集群配置的读写锁，避免并发的增删改请求及文件重新加载交错写入
+clusters_lock = threading.RLock()
+
+
 # 从文件加载集群配置
+clusters_file_stat = config_file_stat()
+# 最近一次由本进程写入的文件内容
+clusters_file_text = None
 clusters = load_clusters()
 
-# 预创建每个集群的客户端，避免每个请求重复初始化
+# 集群客户端在首次使用时创建并缓存，避免启动时逐个连接所有集群
 clients = {}
+# 每个集群一把锁，同一集群的并发请求只创建一次客户端，不同集群互不阻塞
+_client_locks = {}
+_client_locks_lock = threading.Lock()
+
+
+def create_client(cluster_info):
+    """根据集群配置创建客户端"""
+    return K8sClientSvc(
+        namespace=cluster_info.get('namespace', 'default'),
+        k8s_controller=cluster_info.get('k8s_controller', 'SSH'),
+        ssh_config=cluster_info.get('ssh_config'),
+        kube_config=cluster_info.get('kube_config'),
+        kube_options=cluster_info.get('kube_options'),
+        watch_cache=cluster_info.get('watch_cache')
+    )
 
 
-def init_clients():
-    """根据已加载的集群配置初始化客户端"""
-    for cluster_id, cluster_info in clusters.items():
+def _client_lock(cluster_id):
+    with _client_locks_lock:
+        return _client_locks.setdefault(cluster_id, threading.Lock())
+
+
+def get_client(cluster_id):
+    """
+    获取集群客户端，不存在时创建；集群不存在时返回 None，创建失败时抛出异常
+    """
+    client = clients.get(cluster_id)
+    if client is not None:
+        return client
+    with _client_lock(cluster_id):
+        while True:
+            client = clients.get(cluster_id)
+            if client is not None:
+                return client
+            cluster_info = clusters.get(cluster_id)
+            if cluster_info is None:
+                return None
+            client = create_client(cluster_info)
+            # 与重新加载互斥：重新加载在 clusters_lock 内更新配置并移除旧客户端
+            with clusters_lock:
+                if clusters.get(cluster_id) is cluster_info:
+                    clients[cluster_id] = client
+                    return client
+            # 创建期间集群配置已被删除或修改，按最新配置重试
+            client.close()
+
+
+def close_client(cluster_id):
+    """关闭并移除集群客户端，下次使用时按最新配置重新创建"""
+    with _client_lock(cluster_id):
+        client = clients.pop(cluster_id, None)
+    close_removed_clients({cluster_id: client})
+
+
+def close_removed_clients(removed):
+    """
+    关闭已从缓存中移除的客户端
+    :param removed: {集群ID: 客户端或 None}
+    """
+    for cluster_id, client in removed.items():
+        if client is None:
+            continue
         try:
-            clients[cluster_id] = K8sClientSvc(
-                namespace=cluster_info.get('namespace', 'default'),
-                k8s_controller=cluster_info.get('k8s_controller', 'SSH'),
-                ssh_config=cluster_info.get('ssh_config'),
-                kube_config=cluster_info.get('kube_config')
-            )
+            client.close()
         except Exception as e:
-            # 初始化失败仅记录，相关接口会返回错误
-            print(f"初始化集群客户端失败 {cluster_id}: {e}")
+            print(f"关闭集群客户端失败 {cluster_id}: {e}")
+
+
+def reload_clusters():
+    """
+    重新读取配置文件并与内存中的集群配置比较，更新新增、删除或配置有变化的集群并移除其客户端，
+    其余集群的连接和缓存保持不变；须持有 clusters_lock，移除的客户端由调用方在释放锁后关闭
+    :return: {有变化的集群ID: 移除的客户端或 None}
+    """
+    new_clusters = read_clusters_file()
+    changed = [cluster_id for cluster_id in list(clusters) if cluster_id not in new_clusters]
+    for cluster_id in changed:
+        clusters.pop(cluster_id, None)
+    for cluster_id, cluster_info in new_clusters.items():
+        if clusters.get(cluster_id) != cluster_info:
+            clusters[cluster_id] = cluster_info
+            changed.append(cluster_id)
+    return {cluster_id: clients.pop(cluster_id, None) for cluster_id in changed}
+
+
+def _sync_clusters_file():
+    """
+    配置文件指纹与本进程最近一次加载或写入时不同则重新加载，须持有 clusters_lock
+    :return: {有变化的集群ID: 移除的客户端或 None}
+    """
+    global clusters_file_stat
+    stat = config_file_stat()
+    if stat is None or stat == clusters_file_stat:
+        return {}
+    clusters_file_stat = stat
+    try:
+        removed = reload_clusters()
+    except Exception as e:
+        # 文件可能正在写入，下次变化时重试
+        print(f"重新加载集群配置文件失败: {e}")
+        return {}
+    if removed:
+        print(f"集群配置已重新加载，变化的集群: {', '.join(removed)}")
+    return removed
+
+
+def sync_clusters_file():
+    """
+    同步配置文件的变化，包括手动编辑、配置管理工具替换文件以及多 worker 部署时其他 worker 的写入。
+    文件未变化时不加锁直接返回；在锁内只更新配置并移除旧客户端，关闭连接放在释放锁之后，
+    避免断开连接较慢时阻塞其他请求
+    :return: 有变化的集群ID列表
+    """
+    if config_file_stat() == clusters_file_stat:
+        return []
+    with clusters_lock:
+        removed = _sync_clusters_file()
+    close_removed_clients(removed)
+    return list(removed)
+
+
+@contextmanager
+def clusters_write_lock():
+    """
+    修改集群配置时持有的锁：进程内的 clusters_lock 加上锁文件上的 flock，不可嵌套。
+    多个 gunicorn worker 各自持有一份集群配置，进入时先在锁内同步文件，
+    保证 同步 -> 修改 -> 写入 整体串行，否则两个 worker 先后写入时前一个的修改会丢失；
+    同步时移除的旧客户端在释放锁后关闭
+    """
+    removed = {}
+    try:
+        with clusters_lock:
+            if fcntl is None:
+                removed = _sync_clusters_file()
+                yield
+                return
+            with open(CLUSTERS_LOCK_FILE, 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    removed = _sync_clusters_file()
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    finally:
+        close_removed_clients(removed)
+
+
+def watch_clusters_file(interval):
+    """
+    定期检查配置文件是否变化，空闲的 worker 也能及时关闭已删除或已变化集群的连接
+    """
+    while True:
+        time.sleep(interval)
+        sync_clusters_file()
+
+
+if CLUSTERS_RELOAD_INTERVAL > 0:
+    threading.Thread(
+        target=watch_clusters_file, args=(CLUSTERS_RELOAD_INTERVAL,), daemon=True, name="watch-clusters-file"
+    ).start()
+
+
+# 多集群操作的并发执行器
+fanout = FanOutExecutor()
+
+
+def warm_up_clients():
+    """
+    在后台线程中并发创建所有集群的客户端，不阻塞服务启动；
+    设置环境变量 CLUSTER_WARM_UP=1 开启，否则在首次请求时创建
+    """
+    def run():
+        calls = {
+            cluster_id: lambda cluster_id=cluster_id: get_client(cluster_id)
+            for cluster_id in list(clusters)
+        }
+        for cluster_id, outcome in fanout.run(calls).items():
+            if not outcome['success']:
+                print(f"初始化集群客户端失败 {cluster_id}: {outcome['error']}")
+
+    threading.Thread(target=run, daemon=True, name="warm-up-clients").start()
+
+
+if os.environ.get('CLUSTER_WARM_UP', '').lower() in ('1', 'true', 'yes'):
+    warm_up_clients()
 
 
-init_clients()
+def close_clients():
+    """
+    关闭全部集群连接及跳板机连接，进程退出（含 gunicorn worker 退出）时调用
+    """
+    for cluster_id in list(clients):
+        close_client(cluster_id)
+    jump_transports.close_all()
+    fanout.shutdown()
+
+
+atexit.register(close_clients)
+
+
+@app.before_request
+def sync_clusters_before_request():
+    """
+    处理 API 请求前同步配置文件；多 worker 部署时各进程各自持有集群配置，
+    某个 worker 增删改集群后其他 worker 据此重新加载
+    """
+    if request.path.startswith('/api/'):
+        sync_clusters_file()
 
 
 def get_cluster_client(cluster_id):
-    """获取已初始化的集群客户端"""
+    """获取集群客户端，首次使用时创建"""
     if cluster_id not in clusters:
         return None, (jsonify({"error": "Cluster not found"}), 404)
-    client = clients.get(cluster_id)
+    try:
+        client = get_client(cluster_id)
+    except Exception as e:
+        return None, (jsonify({"error": f"初始化集群客户端失败: {e}"}), 500)
     if not client:
-        return None, (jsonify({"error": "Cluster client not initialized"}), 500)
+        return None, (jsonify({"error": "Cluster not found"}), 404)
     return client, None
 
 
@@ -116,7 +397,39 @@ def serve_vue_app(path):
 @app.route('/api/clusters', methods=['GET'])
 def get_clusters():
     """获取集群列表"""
-    return jsonify(list(clusters.values()))
+    return json_etag_response(list(clusters.values()))
+
+
+def get_fanout_timeout():
+    """读取多集群操作的单集群超时参数"""
+    try:
+        return float(request.args.get('timeout', DEFAULT_TIMEOUT))
+    except ValueError:
+        return DEFAULT_TIMEOUT
+
+
+def fan_out(func):
+    """
+    对所有集群并发执行 func(cluster_id, client)，返回各集群的部分结果
+    """
+    def call(cluster_id):
+        # 客户端在线程池中按需创建，未连接过的集群也并发初始化
+        client = get_client(cluster_id)
+        if client is None:
+            raise Exception("Cluster not found")
+        return func(cluster_id, client)
+
+    calls = {cluster_id: lambda cluster_id=cluster_id: call(cluster_id) for cluster_id in list(clusters)}
+    return fanout.run(calls, get_fanout_timeout())
+
+
+@app.route('/api/clusters/health', methods=['GET'])
+def get_clusters_health():
+    """并发检查所有集群的连通性"""
+    def check(cluster_id, client):
+        return {"namespaces": len(client.get_namespace())}
+
+    return jsonify(fan_out(check))
 
 
 @app.route('/api/clusters', methods=['POST'])
@@ -124,30 +437,107 @@ def add_cluster():
     """添加新集群"""
     data = request.json
     cluster_id = data['name']
-    k8s_controller = data.get('k8s_controller', 'SSH')
 
     # 先初始化客户端，避免反复创建
     try:
-        client = K8sClientSvc(
-            namespace=data.get('namespace', 'default'),
-            k8s_controller=k8s_controller,
-            ssh_config=data.get('ssh_config'),
-            kube_config=data.get('kube_config')
-        )
+        client = create_client(data)
     except Exception as e:
         return jsonify({"success": False, "error": f"初始化集群客户端失败: {e}"}), 500
 
-    # 添加到内存中的集群字典
-    clusters[cluster_id] = data
+    with clusters_write_lock():
+        # 添加到内存中的集群字典
+        clusters[cluster_id] = data
 
-    # 保存到YAML文件
-    if save_clusters(clusters):
-        clients[cluster_id] = client
-        return jsonify({"success": True, "cluster_id": cluster_id})
-    else:
+        # 保存到YAML文件
+        if save_clusters(clusters):
+            clients[cluster_id] = client
+            return jsonify({"success": True, "cluster_id": cluster_id})
         # 如果保存失败，从内存中移除
         del clusters[cluster_id]
-        return jsonify({"success": False, "error": "保存集群配置失败"}), 500
+    client.close()
+    return jsonify({"success": False, "error": "保存集群配置失败"}), 500
+
+
+def get_page_limit():
+    """
+    解析分页参数 limit，未传时返回 None 表示不分页
+    """
+    limit = request.args.get('limit')
+    if not limit:
+        return None
+    if not limit.isdigit() or int(limit) <= 0:
+        raise ParamError("limit 应为正整数")
+    return int(limit)
+
+
+def get_bool_arg(name):
+    """
+    解析布尔类型的查询参数
+    """
+    return request.args.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def get_int_arg(name):
+    """
+    解析整数类型的查询参数，未传时返回 None
+    """
+    value = request.args.get(name)
+    if not value:
+        return None
+    if not value.isdigit():
+        raise ParamError(f"{name} 应为非负整数")
+    return int(value)
+
+
+def json_etag_response(data, etag=None):
+    """
+    返回带 ETag 的 JSON 响应，与请求的 If-None-Match 一致时返回 304（不含响应体）
+    :param etag: 未指定时按序列化后的内容计算
+    """
+    if etag and etag in request.if_none_match:
+        # 未变化，跳过序列化
+        response = Response(status=304)
+    else:
+        response = jsonify(data)
+    if etag:
+        response.set_etag(etag)
+    else:
+        response.add_etag()
+    # 要求浏览器每次携带 If-None-Match 重新验证
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+def resource_etag(detail):
+    """
+    资源详情的 ETag：uid + resourceVersion，对象未变化时无需再序列化即可判断
+    """
+    metadata = detail.get('metadata') or {}
+    uid = metadata.get('uid')
+    resource_version = metadata.get('resourceVersion') or metadata.get('resource_version')
+    if not uid or not resource_version:
+        return None
+    return f"{uid}-{resource_version}"
+
+
+def get_selectors():
+    """
+    解析 labelSelector/fieldSelector 参数，交给 API Server 筛选
+    """
+    return request.args.get('labelSelector') or None, request.args.get('fieldSelector') or None
+
+
+@app.route('/api/clusters/<cluster_id>/connection', methods=['GET'])
+def get_connection_stats(cluster_id):
+    """获取集群连接健康状态"""
+    client, error_resp = get_cluster_client(cluster_id)
+    if error_resp:
+        return error_resp
+
+    try:
+        return jsonify(client.connection_stats())
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
 
 @app.route('/api/clusters/<cluster_id>/namespaces', methods=['GET'])
@@ -163,7 +553,7 @@ def get_namespaces(cluster_id):
         for ns in namespaces:
             if ns['NAME'] == cluster['namespace']:
                 ns['SELECT'] = True
-        return jsonify(namespaces)
+        return json_etag_response(namespaces)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -212,8 +602,35 @@ def get_deployments(cluster_id):
         return error_resp
 
     try:
-        deployments = client.get_deployments(namespace)
-        return jsonify(deployments)
+        label_selector, field_selector = get_selectors()
+        limit = get_page_limit()
+        if limit:
+            return json_etag_response(client.list_page(
+                'deployments', namespace, limit, request.args.get('continue'), label_selector, field_selector
+            ))
+        deployments = client.get_deployments(namespace, label_selector, field_selector)
+        return json_etag_response(deployments)
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/api/clusters/<cluster_id>/resources', methods=['GET'])
+def get_resources(cluster_id):
+    """一次获取多种资源列表，kinds 以逗号分隔，默认全部"""
+    namespace = request.args.get('namespace', 'default')
+    kinds = [kind for kind in request.args.get('kinds', '').split(',') if kind]
+
+    client, error_resp = get_cluster_client(cluster_id)
+    if error_resp:
+        return error_resp
+
+    try:
+        resources = client.get_resources(namespace, kinds)
+        return json_etag_response(resources)
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -238,12 +655,16 @@ def get_deployment_detail(cluster_id, source_type, source_name):
             return jsonify({"error": "Source type " + source_type + " not supported"}), 500
     except Exception as e:
         return jsonify({"error": str(e)}), 500
-    if type(_detail_) == dict:
+    if type(_detail_) != dict:
+        return jsonify(_detail_)
+    etag = resource_etag(_detail_)
+    # SSH 方式已直接返回 kubectl 输出的 YAML；对象未变化时 304 无需输出 YAML
+    if 'yaml' not in _detail_ and not (etag and etag in request.if_none_match):
         try:
-            _detail_['yaml'] = yaml.dump(_detail_)
+            _detail_['yaml'] = cached_yaml_dump(_detail_)
         except Exception as ignore:
             pass
-    return jsonify(_detail_)
+    return json_etag_response(_detail_, etag)
 
 
 @app.route('/api/clusters/<cluster_id>/deployments', methods=['POST'])
@@ -294,8 +715,16 @@ def get_services(cluster_id):
         return error_resp
 
     try:
-        services = client.get_services(namespace)
-        return jsonify(services)
+        label_selector, field_selector = get_selectors()
+        limit = get_page_limit()
+        if limit:
+            return json_etag_response(client.list_page(
+                'services', namespace, limit, request.args.get('continue'), label_selector, field_selector
+            ))
+        services = client.get_services(namespace, label_selector, field_selector)
+        return json_etag_response(services)
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -361,12 +790,70 @@ def get_pods(cluster_id):
         return error_resp
 
     try:
-        pods = client.get_pods(namespace)
-        return jsonify(pods)
+        label_selector, field_selector = get_selectors()
+        limit = get_page_limit()
+        if limit:
+            return json_etag_response(client.list_page(
+                'pods', namespace, limit, request.args.get('continue'), label_selector, field_selector
+            ))
+        pods = client.get_pods(namespace, label_selector, field_selector)
+        return json_etag_response(pods)
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/clusters/<cluster_id>/deployments/<deployment_name>/pods', methods=['GET'])
+def get_deployment_pods(cluster_id, deployment_name):
+    """获取Deployment下的Pod列表（按 spec.selector 筛选）"""
+    namespace = request.args.get('namespace', 'default')
+
+    client, error_resp = get_cluster_client(cluster_id)
+    if error_resp:
+        return error_resp
+
+    try:
+        pods = client.get_deployment_pods(deployment_name, namespace)
+        return json_etag_response(pods)
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route('/api/clusters/<cluster_id>/deployments/<deployment_name>/logs/stream', methods=['GET'])
+def stream_deployment_logs(cluster_id, deployment_name):
+    """合并Deployment所有副本的日志（SSE），按时间排序并标记 [pod/container]"""
+    namespace = request.args.get('namespace', 'default')
+
+    client, error_resp = get_cluster_client(cluster_id)
+    if error_resp:
+        return error_resp
+
+    try:
+        lines = client.stream_deployment_logs(
+            deployment_name,
+            namespace,
+            follow=get_bool_arg('follow'),
+            lines=get_int_arg('lines'),
+            since_seconds=get_int_arg('sinceSeconds'),
+            idle_timeout=LOG_HEARTBEAT_INTERVAL,
+        )
+    except StreamLimitError as e:
+        return jsonify({"error": str(e)}), 503
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    return Response(
+        sse_lines(lines),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
 @app.route('/api/clusters/<cluster_id>/configmaps', methods=['GET'])
 def get_configmaps(cluster_id):
     """获取ConfigMap列表"""
@@ -377,8 +864,16 @@ def get_configmaps(cluster_id):
         return error_resp
 
     try:
-        configmaps = client.get_configmaps(namespace)
-        return jsonify(configmaps)
+        label_selector, field_selector = get_selectors()
+        limit = get_page_limit()
+        if limit:
+            return json_etag_response(client.list_page(
+                'configmaps', namespace, limit, request.args.get('continue'), label_selector, field_selector
+            ))
+        configmaps = client.get_configmaps(namespace, label_selector, field_selector)
+        return json_etag_response(configmaps)
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -393,8 +888,16 @@ def get_ingresses(cluster_id):
         return error_resp
 
     try:
-        ingresses = client.get_ingresses(namespace)
-        return jsonify(ingresses)
+        label_selector, field_selector = get_selectors()
+        limit = get_page_limit()
+        if limit:
+            return json_etag_response(client.list_page(
+                'ingresses', namespace, limit, request.args.get('continue'), label_selector, field_selector
+            ))
+        ingresses = client.get_ingresses(namespace, label_selector, field_selector)
+        return json_etag_response(ingresses)
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -519,6 +1022,73 @@ def get_pod_logs(cluster_id, pod_name):
         return jsonify({"error": str(e)}), 500
 
 
+@app.route('/api/clusters/<cluster_id>/pods/<pod_name>/logs/stream', methods=['GET'])
+def stream_pod_logs(cluster_id, pod_name):
+    """流式获取Pod日志（SSE），follow=true 时持续推送新日志"""
+    namespace = request.args.get('namespace', 'default')
+
+    client, error_resp = get_cluster_client(cluster_id)
+    if error_resp:
+        return error_resp
+
+    try:
+        chunks = client.stream_logs(
+            namespace,
+            pod_name,
+            container=request.args.get('container') or None,
+            follow=get_bool_arg('follow'),
+            lines=get_int_arg('lines'),
+            timestamps=get_bool_arg('timestamps'),
+            idle_timeout=LOG_HEARTBEAT_INTERVAL,
+        )
+    except StreamLimitError as e:
+        return jsonify({"error": str(e)}), 503
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    return Response(
+        sse_events(chunks),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+@app.route('/api/clusters/<cluster_id>/pods/<pod_name>/logs/download', methods=['GET'])
+def download_pod_logs(cluster_id, pod_name):
+    """下载Pod日志（gzip 压缩，边读取边压缩输出）"""
+    namespace = request.args.get('namespace', 'default')
+
+    client, error_resp = get_cluster_client(cluster_id)
+    if error_resp:
+        return error_resp
+
+    try:
+        # 先读到第一块日志再发送响应头，SSH 方式 kubectl logs 失败时与 KUBE 方式一样返回错误
+        chunks = prefetch(client.stream_logs(
+            namespace,
+            pod_name,
+            container=request.args.get('container') or None,
+            lines=get_int_arg('lines'),
+            timestamps=get_bool_arg('timestamps'),
+            since_seconds=get_int_arg('sinceSeconds'),
+            since_time=request.args.get('sinceTime') or None,
+            limit_bytes=get_int_arg('limitBytes'),
+            previous=get_bool_arg('previous'),
+        ))
+    except ParamError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    return Response(
+        gzip_chunks(chunks),
+        mimetype='application/gzip',
+        headers={'Content-Disposition': f'attachment; filename="{pod_name}.log.gz"'},
+    )
+
+
 @app.route('/api/clusters/<cluster_id>/search-deployments-by-image', methods=['GET'])
 def search_deployments_by_image(cluster_id):
     """根据镜像名称查询工作负载"""
@@ -534,23 +1104,43 @@ def search_deployments_by_image(cluster_id):
 
     try:
         deoloy_images = client.get_deployment_images(namespace)
-
-        # 筛选包含指定镜像的部署
-        # 这里简化处理，实际需要根据具体情况调整
-        matching_deployments = []
-        for deoloy_image in deoloy_images:
-            if str(deoloy_image["IMAGES"]).startswith(image_name.split(":")[0]):
-                matching_deployments.append({
-                    "name": deoloy_image.get("NAME", ""),
-                    "ready": deoloy_image.get("READY", ""),
-                    "image": deoloy_image.get("IMAGES", ""),
-                    "namespace": namespace
-                })
+        matching_deployments = match_deployments_by_image(deoloy_images, image_name, namespace)
         return jsonify({"success": True, "deployments": matching_deployments})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+def match_deployments_by_image(deoloy_images, image_name, namespace):
+    """筛选包含指定镜像的部署"""
+    # 这里简化处理，实际需要根据具体情况调整
+    matching_deployments = []
+    for deoloy_image in deoloy_images:
+        if str(deoloy_image["IMAGES"]).startswith(image_name.split(":")[0]):
+            matching_deployments.append({
+                "name": deoloy_image.get("NAME", ""),
+                "ready": deoloy_image.get("READY", ""),
+                "image": deoloy_image.get("IMAGES", ""),
+                "namespace": namespace
+            })
+    return matching_deployments
+
+
+@app.route('/api/search-deployments-by-image', methods=['GET'])
+def search_deployments_by_image_all_clusters():
+    """在所有集群中并发查询使用指定镜像的工作负载，未指定命名空间时使用各集群的默认命名空间"""
+    namespace = request.args.get('namespace')
+    image_name = request.args.get('image', '')
+
+    if not image_name:
+        return jsonify({"error": "Image name is required"}), 400
+
+    def search(cluster_id, client):
+        ns = namespace or clusters.get(cluster_id, {}).get('namespace', 'default')
+        return match_deployments_by_image(client.get_deployment_images(ns), image_name, ns)
+
+    return jsonify(fan_out(search))
+
+
 @app.route('/api/clusters/<cluster_id>/deployments/<deployment_name>/scale', methods=['POST'])
 def scale_deployment(cluster_id, deployment_name):
     """伸缩容器副本数"""
@@ -585,59 +1175,58 @@ def update_cluster(cluster_id):
     data = request.json
     new_name = data.get('name')
 
-    if cluster_id not in clusters:
-        return jsonify({"error": "Cluster not found"}), 404
-
     if not new_name:
         return jsonify({"error": "Cluster name is required"}), 400
 
-    # 更新集群名称
-    cluster = clusters[cluster_id]
-    old_name = cluster['name']
-    cluster['name'] = new_name
+    with clusters_write_lock():
+        if cluster_id not in clusters:
+            return jsonify({"error": "Cluster not found"}), 404
 
-    # 如果集群ID是根据旧名称生成的，也需要更新
-    if cluster_id == old_name:
-        new_cluster_id = new_name
-        clusters[new_cluster_id] = cluster
-        del clusters[cluster_id]
-        if cluster_id in clients:
-            clients[new_cluster_id] = clients.pop(cluster_id)
+        # 更新集群名称
+        cluster = clusters[cluster_id]
+        old_name = cluster['name']
+        cluster['name'] = new_name
 
-    # 保存到文件
-    if save_clusters(clusters):
-        return jsonify({"success": True, "cluster_id": cluster_id})
-    else:
-        # 回滚更改
-        cluster['name'] = old_name
+        # 如果集群ID是根据旧名称生成的，也需要更新
         if cluster_id == old_name:
-            clusters[cluster_id] = cluster
-            del clusters[new_cluster_id]
-            if new_cluster_id in clients:
-                clients[cluster_id] = clients.pop(new_cluster_id)
-        return jsonify({"success": False, "error": "保存集群配置失败"}), 500
+            new_cluster_id = new_name
+            clusters[new_cluster_id] = cluster
+            del clusters[cluster_id]
+            if cluster_id in clients:
+                clients[new_cluster_id] = clients.pop(cluster_id)
+
+        # 保存到文件
+        if save_clusters(clusters):
+            return jsonify({"success": True, "cluster_id": cluster_id})
+        else:
+            # 回滚更改
+            cluster['name'] = old_name
+            if cluster_id == old_name:
+                clusters[cluster_id] = cluster
+                del clusters[new_cluster_id]
+                if new_cluster_id in clients:
+                    clients[cluster_id] = clients.pop(new_cluster_id)
+            return jsonify({"success": False, "error": "保存集群配置失败"}), 500
 
 
 @app.route('/api/clusters/<cluster_id>', methods=['DELETE'])
 def delete_cluster(cluster_id):
     """删除集群"""
-    if cluster_id not in clusters:
-        return jsonify({"error": "Cluster not found"}), 404
+    with clusters_write_lock():
+        if cluster_id not in clusters:
+            return jsonify({"error": "Cluster not found"}), 404
 
-    backup_cluster = clusters[cluster_id]
-    backup_client = clients.pop(cluster_id, None)
-    # 删除集群
-    del clusters[cluster_id]
+        backup_cluster = clusters[cluster_id]
+        # 删除集群
+        del clusters[cluster_id]
 
-    # 保存到文件
-    if save_clusters(clusters):
-        return jsonify({"success": True})
-    else:
-        # 如果保存失败，需要恢复集群（这里简化处理，实际应该更复杂）
-        clusters[cluster_id] = backup_cluster
-        if backup_client:
-            clients[cluster_id] = backup_client
-        return jsonify({"success": False, "error": "保存集群配置失败"}), 500
+        # 保存到文件
+        if not save_clusters(clusters):
+            # 如果保存失败，恢复集群，客户端未关闭可继续使用
+            clusters[cluster_id] = backup_cluster
+            return jsonify({"success": False, "error": "保存集群配置失败"}), 500
+    close_client(cluster_id)
+    return jsonify({"success": True})
 
 
 if __name__ == '__main__':
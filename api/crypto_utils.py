@@ -4,6 +4,7 @@
 """
 import base64
 import os
+import threading
 
 from cryptography.fernet import Fernet
 
@@ -19,6 +20,12 @@ class CryptoManager:
         self.key_file = key_file
         self.key = self._load_or_generate_key()
         self.cipher = Fernet(self.key)
+        # 字段 -> (明文, 密文)：同一字段的密码未变化时保存时复用原密文；
+        # 按字段而不是按明文缓存，不同字段的相同密码仍各自加密，文件中看不出密码重复
+        self._ciphertexts = {}
+        # 密文 -> 明文：重复加载时无需再次解密
+        self._plaintexts = {}
+        self._cache_lock = threading.Lock()
     
     def _load_or_generate_key(self):
         """加载或生成加密密钥"""
@@ -34,14 +41,21 @@ class CryptoManager:
             print(f"已生成新的加密密钥文件: {self.key_file}")
             return key
     
-    def encrypt(self, data):
+    def encrypt(self, data, field=None):
         """
         加密数据
         :param data: 要加密的字符串
+        :param field: 字段标识（如 (集群ID, 'password')），该字段明文未变化时复用上次的密文
         :return: 加密后的字符串（Base64编码）
         """
         if not data:
             return data
+
+        if field is not None:
+            with self._cache_lock:
+                cached = self._ciphertexts.get(field)
+            if cached is not None and cached[0] == data:
+                return cached[1]
         
         # 将字符串转换为bytes
         data_bytes = data.encode('utf-8')
@@ -51,13 +65,16 @@ class CryptoManager:
         
         # 转换为Base64字符串以便存储
         encrypted_str = base64.b64encode(encrypted_bytes).decode('utf-8')
-        
-        return f"ENC:{encrypted_str}"
+
+        encrypted = f"ENC:{encrypted_str}"
+        self._remember(data, encrypted, field)
+        return encrypted
     
-    def decrypt(self, data):
+    def decrypt(self, data, field=None):
         """
         解密数据
         :param data: 要解密的字符串（以ENC:开头）
+        :param field: 字段标识，记录该字段的密文供保存时复用
         :return: 解密后的字符串
         """
         if not data:
@@ -67,6 +84,12 @@ class CryptoManager:
         if not isinstance(data, str) or not data.startswith('ENC:'):
             # 未加密的数据直接返回
             return data
+
+        with self._cache_lock:
+            cached = self._plaintexts.get(data)
+        if cached is not None:
+            self._remember(cached, data, field)
+            return cached
         
         try:
             # 移除ENC:前缀
@@ -80,16 +103,24 @@ class CryptoManager:
             
             # 转换为字符串
             decrypted_str = decrypted_bytes.decode('utf-8')
-            
+
+            self._remember(decrypted_str, data, field)
             return decrypted_str
         except Exception as e:
             print(f"解密失败: {e}")
             return data
     
-    def encrypt_ssh_config(self, ssh_config):
+    def _remember(self, plaintext, ciphertext, field=None):
+        with self._cache_lock:
+            self._plaintexts[ciphertext] = plaintext
+            if field is not None:
+                self._ciphertexts[field] = (plaintext, ciphertext)
+
+    def encrypt_ssh_config(self, ssh_config, field=()):
         """
         加密SSH配置中的敏感信息
         :param ssh_config: SSH配置字典
+        :param field: 该配置所在位置（如 (集群ID,)），用于复用未变化字段的密文
         :return: 加密后的配置字典
         """
         if not ssh_config:
@@ -99,17 +130,33 @@ class CryptoManager:
         
         # 加密密码
         if 'password' in encrypted_config and encrypted_config['password']:
-            encrypted_config['password'] = self.encrypt(encrypted_config['password'])
+            encrypted_config['password'] = self.encrypt(
+                encrypted_config['password'], field + ('password',)
+            )
+
+        # 私钥口令
+        if encrypted_config.get('key_passphrase'):
+            encrypted_config['key_passphrase'] = self.encrypt(
+                encrypted_config['key_passphrase'], field + ('key_passphrase',)
+            )
+
+        # 加密跳板机密码
+        if encrypted_config.get('jump_hosts'):
+            encrypted_config['jump_hosts'] = [
+                self.encrypt_ssh_config(host, field + ('jump_hosts', i))
+                for i, host in enumerate(encrypted_config['jump_hosts'])
+            ]
         
         # 如果有其他敏感字段也可以加密
         # 例如: username, hostname等
         
         return encrypted_config
     
-    def decrypt_ssh_config(self, ssh_config):
+    def decrypt_ssh_config(self, ssh_config, field=()):
         """
         解密SSH配置中的敏感信息
         :param ssh_config: SSH配置字典
+        :param field: 该配置所在位置（如 (集群ID,)），与 encrypt_ssh_config 一致
         :return: 解密后的配置字典
         """
         if not ssh_config:
@@ -119,7 +166,22 @@ class CryptoManager:
         
         # 解密密码
         if 'password' in decrypted_config and decrypted_config['password']:
-            decrypted_config['password'] = self.decrypt(decrypted_config['password'])
+            decrypted_config['password'] = self.decrypt(
+                decrypted_config['password'], field + ('password',)
+            )
+
+        # 私钥口令
+        if decrypted_config.get('key_passphrase'):
+            decrypted_config['key_passphrase'] = self.decrypt(
+                decrypted_config['key_passphrase'], field + ('key_passphrase',)
+            )
+
+        # 解密跳板机密码
+        if decrypted_config.get('jump_hosts'):
+            decrypted_config['jump_hosts'] = [
+                self.decrypt_ssh_config(host, field + ('jump_hosts', i))
+                for i, host in enumerate(decrypted_config['jump_hosts'])
+            ]
         
         return decrypted_config
 
@@ -0,0 +1,121 @@
+"""
+多集群并发执行
+每个调用在独立线程中运行阻塞的 SSH / SDK 调用，通过信号量限制同时运行的数量，再由 asyncio 汇总结果：
+多集群操作的耗时取决于最慢的集群而不是各集群耗时之和，单个集群超时或失败只影响自身结果
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from functools import partial
+
+# 同时运行的阻塞调用数上限
+DEFAULT_MAX_WORKERS = 16
+# 单个集群调用的默认超时（秒）
+DEFAULT_TIMEOUT = 30
+
+
+class _Slot:
+    """
+    已占用的并发名额，可重复释放；调用超时即释放，卡住的线程不再占用名额
+    """
+
+    def __init__(self, semaphore):
+        self._semaphore = semaphore
+        self._lock = threading.Lock()
+        self._held = True
+
+    def release(self):
+        with self._lock:
+            if not self._held:
+                return
+            self._held = False
+        self._semaphore.release()
+
+
+class FanOutExecutor:
+    """
+    多集群并发执行器
+    超时从调用真正开始运行时计算，不包括等待并发名额的时间；
+    注意：超时只会放弃等待并释放名额，已在运行的阻塞调用会在自己的线程中继续执行直至返回
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        self._slots = threading.Semaphore(max_workers)
+        self._closed = False
+
+    def _start(self, func):
+        """
+        在新线程中等待并发名额后执行调用
+        :return: (名额 Future，结果 Future)
+        """
+        if self._closed:
+            raise RuntimeError("执行器已关闭")
+        started = Future()
+        done = Future()
+
+        def run():
+            self._slots.acquire()
+            slot = _Slot(self._slots)
+            if self._closed or not started.set_running_or_notify_cancel():
+                slot.release()
+                done.cancel()
+                return
+            done.set_running_or_notify_cancel()
+            started.set_result(slot)
+            try:
+                result = func()
+            except BaseException as e:
+                done.set_exception(e)
+            else:
+                done.set_result(result)
+            finally:
+                slot.release()
+
+        threading.Thread(target=run, daemon=True, name="fanout").start()
+        return started, done
+
+    async def call(self, func, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        """
+        在独立线程中执行阻塞调用，超时从获得并发名额开始计算
+        """
+        started, done = self._start(partial(func, *args, **kwargs))
+        slot = await asyncio.wrap_future(started)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(done), timeout)
+        finally:
+            slot.release()
+
+    async def gather(self, calls: dict, timeout=DEFAULT_TIMEOUT) -> dict:
+        """
+        并发执行多个调用并收集部分结果
+        :param calls: {集群ID: 无参可调用对象}
+        :param timeout: 每个集群的超时秒数，可为数值或 {集群ID: 秒数}
+        :return: {集群ID: {"success", "result" 或 "error", "elapsed"}}
+        """
+
+        async def run_one(key, func):
+            key_timeout = timeout.get(key, DEFAULT_TIMEOUT) if isinstance(timeout, dict) else timeout
+            start = time.monotonic()
+            try:
+                result = await self.call(func, timeout=key_timeout)
+                outcome = {"success": True, "result": result}
+            except asyncio.TimeoutError:
+                outcome = {"success": False, "error": f"执行超时（{key_timeout}s）"}
+            except Exception as e:
+                outcome = {"success": False, "error": str(e)}
+            outcome["elapsed"] = round(time.monotonic() - start, 3)
+            return key, outcome
+
+        pairs = await asyncio.gather(*(run_one(key, func) for key, func in calls.items()))
+        return dict(pairs)
+
+    def run(self, calls: dict, timeout=DEFAULT_TIMEOUT) -> dict:
+        """
+        同步入口，供 Flask 视图等非异步代码调用
+        """
+        return asyncio.run(self.gather(calls, timeout))
+
+    def shutdown(self):
+        """不再接受新调用，尚未开始运行的调用被取消"""
+        self._closed = True
@@ -1,14 +1,45 @@
+import hashlib
+import math
 import os
+import re
+import shlex
+import threading
 import yaml
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List
+from urllib.parse import quote, urlencode
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
-import tempfile
-import os
-from ssh_client import SSHClient
+import k8s_rows
+import log_stream
+from k8s_rows import ParamError, json_loads
+from ssh_client import QuotaStream, SSHClient, StreamLimitError
+from watch_cache import WatchCache, abort_response
+
+try:
+    # libyaml 可用时使用 C 实现的解析/输出
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+# SSH 方式列表命令的输出上限及超时
+SSH_LIST_MAX_BYTES = 64 * 1024 * 1024
+SSH_LIST_TIMEOUT = 120
+# SSH 方式获取日志的输出上限
+SSH_LOGS_MAX_BYTES = 32 * 1024 * 1024
+# Deployment 合并日志：日志源数量上限、并行获取的线程数、每个日志源的默认行数及字节上限
+MERGED_LOG_MAX_SOURCES = 50
+MERGED_LOG_WORKERS = 8
+MERGED_LOG_DEFAULT_LINES = 500
+MERGED_LOG_MAX_BYTES = 8 * 1024 * 1024
+# follow 合并时各日志源的空闲检查间隔（秒），用于及时响应客户端断开
+MERGED_LOG_TICK = 1
+# 详情 YAML 缓存条数
+DETAIL_YAML_CACHE_SIZE = 256
 
 
 class K8sClientSvc:
@@ -19,13 +50,15 @@ class K8sClientSvc:
         k8s_controller="KUBE",  # 操作方式
         ssh_config=None,
         kube_config=None,
+        kube_options=None,
+        watch_cache=None,
     ):
         self.namespace = namespace
         self.k8s_controller = k8s_controller
         if self.k8s_controller == "SSH":
             self.client = SshK8sClient(ssh_config)
         elif self.k8s_controller == "KUBE":
-            self.client = KubeK8sClient(kube_config, namespace)
+            self.client = KubeK8sClient(kube_config, namespace, kube_options, watch_cache)
         else:
             raise NotImplementedError(f"未知的 k8s_controller: {k8s_controller}")
 
@@ -35,45 +68,203 @@ class K8sClientSvc:
         """
         return self.client.get_namespace(ns)
 
-    def get_deployments(self, ns: str = None) -> list[dict]:
+    def connection_stats(self) -> dict:
+        """
+        获取连接健康状态及重连计数
+        """
+        stats = self.client.connection_stats()
+        stats["k8s_controller"] = self.k8s_controller
+        return stats
+
+    def close(self):
+        """
+        关闭底层连接（SSH 连接，或 HTTP 连接池及 watch 缓存）
+        """
+        self.client.close()
+
+    def get_deployments(
+        self, ns: str = None, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取工作负载
         """
         if ns is None:
             ns = self.namespace
-        return self.client.get_deployments(ns)
+        return self.client.get_deployments(ns, label_selector, field_selector)
 
-    def get_pods(self, ns: str = None) -> list[dict]:
+    def get_pods(
+        self, ns: str = None, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取pods
         """
         if ns is None:
             ns = self.namespace
-        return self.client.get_pods(ns)
+        return self.client.get_pods(ns, label_selector, field_selector)
 
-    def get_services(self, ns: str = None) -> list[dict]:
+    def get_services(
+        self, ns: str = None, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取服务
         """
         if ns is None:
             ns = self.namespace
-        return self.client.get_services(ns)
+        return self.client.get_services(ns, label_selector, field_selector)
 
-    def get_configmaps(self, ns: str = None) -> list[dict]:
+    def get_configmaps(
+        self, ns: str = None, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取ConfigMap
         """
         if ns is None:
             ns = self.namespace
-        return self.client.get_configmaps(ns)
+        return self.client.get_configmaps(ns, label_selector, field_selector)
 
-    def get_ingresses(self, ns: str = None) -> list[dict]:
+    def get_ingresses(
+        self, ns: str = None, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取Ingress
         """
         if ns is None:
             ns = self.namespace
-        return self.client.get_ingresses(ns)
+        return self.client.get_ingresses(ns, label_selector, field_selector)
+
+    def get_resources(self, ns: str = None, kinds: list[str] = None) -> dict:
+        """
+        一次获取多种资源的列表，返回 {资源类型: 行列表}
+        """
+        if ns is None:
+            ns = self.namespace
+        return self.client.get_resources(ns, k8s_rows.check_kinds(kinds))
+
+    def list_page(
+        self,
+        kind: str,
+        ns: str = None,
+        limit: int = None,
+        continue_token: str = None,
+        label_selector: str = None,
+        field_selector: str = None,
+    ) -> dict:
+        """
+        分页获取资源列表，返回 {"items": 行列表, "continue": 下一页令牌，最后一页为 None}
+        """
+        if ns is None:
+            ns = self.namespace
+        if not limit or limit <= 0:
+            raise ParamError("limit 应为正整数")
+        (kind,) = k8s_rows.check_kinds([kind])
+        return self.client.list_page(
+            kind, ns, limit, continue_token, label_selector, field_selector
+        )
+
+    def get_deployment_pods(self, deploy_name: str, ns: str = None) -> list[dict]:
+        """
+        获取Deployment下的pods：按 spec.selector 在服务端筛选
+        """
+        if ns is None:
+            ns = self.namespace
+        return self._deployment_pods(deploy_name, ns)[1]
+
+    def _deployment_pods(self, deploy_name: str, ns: str) -> tuple[dict, list[dict]]:
+        """
+        返回 (Deployment 原始 JSON, 匹配 spec.selector 的 pods)
+        """
+        if not deploy_name:
+            raise Exception("deploy_name 非空")
+        deployment = self.client.get_deployment_json(deploy_name, ns)
+        selector = k8s_rows.selector_string(
+            (deployment.get("spec") or {}).get("selector") or {}
+        )
+        if not selector:
+            raise Exception(f"Deployment {deploy_name} 未设置 selector")
+        return deployment, self.client.get_pods(ns, selector)
+
+    def stream_deployment_logs(
+        self,
+        deploy_name: str,
+        ns: str = None,
+        follow: bool = False,
+        lines: int = None,
+        since_seconds: int = None,
+        idle_timeout: float = None,
+    ):
+        """
+        合并Deployment所有副本、所有容器的日志，按时间戳排序，每行以 [pod/container] 标记来源
+        非 follow 模式在有界线程池中并行获取各日志源并缓冲到临时文件，再惰性归并；
+        follow 模式对实时日志流做 k 路归并，日志流名额（所有请求共享）不足时整体失败
+        """
+        if ns is None:
+            ns = self.namespace
+        deployment, pods = self._deployment_pods(deploy_name, ns)
+        template_spec = ((deployment.get("spec") or {}).get("template") or {}).get("spec") or {}
+        containers = [c["name"] for c in template_spec.get("containers") or []]
+        sources = [(pod["NAME"], container) for pod in pods for container in containers]
+        if len(sources) > MERGED_LOG_MAX_SOURCES:
+            raise Exception(f"日志源过多（{len(sources)}），请按 Pod 查看日志")
+        if lines is None and not since_seconds:
+            lines = MERGED_LOG_DEFAULT_LINES
+
+        if follow:
+            max_streams = getattr(self.client, "max_log_streams", None)
+            if max_streams is not None and len(sources) > max_streams:
+                raise Exception(
+                    f"日志源（{len(sources)}）超过可同时打开的日志流数量（{max_streams}）"
+                )
+            streams = []
+            for pod, container in sources:
+                try:
+                    chunks = self.client.stream_logs(
+                        ns,
+                        pod,
+                        container=container,
+                        follow=True,
+                        lines=lines,
+                        timestamps=True,
+                        since_seconds=since_seconds,
+                        idle_timeout=MERGED_LOG_TICK,
+                    )
+                except StreamLimitError:
+                    # 其他请求占用了名额，释放已打开的日志流
+                    for _, opened in streams:
+                        if hasattr(opened, "close"):
+                            opened.close()
+                    raise
+                except Exception as e:
+                    # 单个容器无法打开日志（如尚未启动）时只在合并结果中输出错误行
+                    chunks = log_stream.failed_source(e)
+                streams.append((f"{pod}/{container}", chunks))
+            return log_stream.merge_live(streams, idle_timeout)
+
+        def fetch(source):
+            pod, container = source
+            tag = f"{pod}/{container}"
+            try:
+                chunks = self.client.stream_logs(
+                    ns,
+                    pod,
+                    container=container,
+                    lines=lines,
+                    timestamps=True,
+                    since_seconds=since_seconds,
+                    limit_bytes=MERGED_LOG_MAX_BYTES,
+                )
+                return log_stream.spooled_lines(tag, log_stream.spool_chunks(chunks))
+            except Exception as e:
+                return iter([log_stream.error_line(tag, e)])
+
+        if not sources:
+            return iter(())
+        # SSH 方式每个日志源占用一个通道，并行数须小于通道池大小，给同一集群的其他请求留出通道
+        workers = min(
+            MERGED_LOG_WORKERS, len(sources), getattr(self.client, "max_parallel_logs", MERGED_LOG_WORKERS)
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, sources))
+        return log_stream.merge_sorted(results)
 
     def logs(self, ns: str = None, pod_name: str = None, lines: int = None) -> str:
         if ns is None:
@@ -82,6 +273,50 @@ class K8sClientSvc:
             raise Exception("pod name 非空")
         return self.client.logs(ns, pod_name, lines)
 
+    def stream_logs(
+        self,
+        ns: str = None,
+        pod_name: str = None,
+        container: str = None,
+        follow: bool = False,
+        lines: int = None,
+        timestamps: bool = False,
+        since_seconds: int = None,
+        since_time: str = None,
+        limit_bytes: int = None,
+        previous: bool = False,
+        idle_timeout: float = None,
+    ):
+        """
+        流式获取Pod日志，返回原始字节块的迭代器，不在内存中拼接完整日志
+        follow=True 时持续产出新日志；设置 idle_timeout 时无输出期间产出 b"" 作为心跳
+        since_time 为 RFC3339 时间，与 since_seconds 只能指定一个
+        """
+        if ns is None:
+            ns = self.namespace
+        if not pod_name:
+            raise Exception("pod name 非空")
+        if since_seconds and since_time:
+            raise ParamError("sinceSeconds 与 sinceTime 只能指定一个")
+        if since_time:
+            try:
+                k8s_rows.parse_timestamp(since_time)
+            except ValueError:
+                raise ParamError(f"sinceTime 格式错误: {since_time}")
+        return self.client.stream_logs(
+            ns,
+            pod_name,
+            container=container,
+            follow=follow,
+            lines=lines,
+            timestamps=timestamps,
+            since_seconds=since_seconds,
+            since_time=since_time,
+            limit_bytes=limit_bytes,
+            previous=previous,
+            idle_timeout=idle_timeout,
+        )
+
     def delete_pod(self, ns: str = None, pod_name: str = None) -> str:
         if ns is None:
             ns = self.namespace
@@ -336,7 +571,7 @@ class K8sClientSvc:
                     )
 
         # 转换为YAML格式
-        return yaml.dump(deployment, default_flow_style=False, allow_unicode=True)
+        return yaml_dump(deployment)
 
     def _build_service_yaml(self, service_data: dict) -> str:
         """
@@ -380,7 +615,7 @@ class K8sClientSvc:
             )
 
         # 转换为YAML格式
-        return yaml.dump(service, default_flow_style=False, allow_unicode=True)
+        return yaml_dump(service)
 
     def _build_configmap_yaml(self, configmap_data: dict) -> str:
         """
@@ -402,7 +637,7 @@ class K8sClientSvc:
         }
 
         # 转换为YAML格式
-        return yaml.dump(configmap, default_flow_style=False, allow_unicode=True)
+        return yaml_dump(configmap)
 
     def _build_ingress_yaml(self, ingress_data: dict) -> str:
         """
@@ -451,30 +686,130 @@ class K8sClientSvc:
                 ingress["spec"]["rules"].append(ingress_rule)
 
         # 转换为YAML格式
-        return yaml.dump(ingress, default_flow_style=False, allow_unicode=True)
+        return yaml_dump(ingress)
 
 
 def convert2map(res: dict) -> list[dict]:
     if not res["success"]:
         return []
-    lines = res["output"].splitlines()
-    if len(lines) == 0:
+    return convert_lines2map(res["output"].splitlines())
+
+
+# kubectl 表头的列名之间至少间隔两个空格，列名内部可能含单个空格（如 NOMINATED NODE）
+_HEADER_COLUMN_RE = re.compile(r"\S+(?: \S+)*")
+
+
+def _normalize_field(name: str) -> str:
+    return name.replace("(S)", "S").replace("-", "_").replace(" ", "_")
+
+
+def convert_lines2map(lines: Iterable[str]) -> list[dict]:
+    """
+    将 kubectl 表格输出逐行解析为字典列表，可直接消费流式输出的行迭代器
+    按表头各列的起始偏移切分每一行，单元格内的空格及空单元格均可正确处理；
+    右对齐列的值超出表头起始位置时，切分点左移到该值的起始处
+    """
+    lines = iter(lines)
+    header = next(lines, None)
+    if header is None:
+        return []
+    columns = _HEADER_COLUMN_RE.findall(header.rstrip("\r\n"))
+    if not columns:
         return []
-    header = lines[0]
-    fields = header.split()
+    fields = [_normalize_field(name) for name in columns]
+    starts = [m.start() for m in _HEADER_COLUMN_RE.finditer(header)]
+    bounds = starts[1:]
+    spans = list(zip([0] + bounds, bounds + [None]))
     ns_list = []
-    for line in lines[1:]:
-        ns_item = {}
-        for field in fields:
-            field_name = str(field).replace("-", "_")
-            if field_name.__contains__("PORT"):
-                field_name = "PORTS"
-            if len(line.split()) > fields.index(field):
-                ns_item[field_name] = line.split()[fields.index(field)]
-        ns_list.append(ns_item)
+    for line in lines:
+        line = line.rstrip("\r\n")
+        length = len(line)
+        if not length or line.isspace():
+            continue
+        if not bounds or length > bounds[-1]:
+            # 快速路径：所有切分点都落在空白处时直接按预计算的偏移切片
+            for bound in bounds:
+                if line[bound - 1] != " " and line[bound] != " ":
+                    break
+            else:
+                ns_list.append(
+                    dict(zip(fields, [line[a:b].strip() for a, b in spans]))
+                )
+                continue
+        cuts = [0]
+        for bound in bounds:
+            if bound >= length:
+                break
+            # 切分点落在某个值的中间，说明该值属于右侧的右对齐列
+            if line[bound - 1] != " " and line[bound] != " ":
+                while bound > cuts[-1] and line[bound - 1] != " ":
+                    bound -= 1
+            cuts.append(bound)
+        cuts.append(length)
+        values = [line[a:b].strip() for a, b in zip(cuts, cuts[1:])]
+        values += [""] * (len(fields) - len(values))
+        ns_list.append(dict(zip(fields, values)))
     return ns_list
 
 
+def yaml_load(text: str):
+    return yaml.load(text, Loader=YamlLoader)
+
+
+def yaml_dump(data) -> str:
+    return yaml.dump(data, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
+
+
+_detail_yaml_cache = OrderedDict()
+_detail_yaml_lock = threading.Lock()
+
+
+def cached_yaml_dump(detail: dict) -> str:
+    """
+    输出资源详情的 YAML，按 uid+resourceVersion 缓存（LRU），对象未变化时不再重复序列化
+    """
+    metadata = detail.get("metadata") or {}
+    uid = metadata.get("uid")
+    resource_version = metadata.get("resourceVersion") or metadata.get("resource_version")
+    if not uid or not resource_version:
+        return yaml_dump(detail)
+    key = (uid, resource_version)
+    with _detail_yaml_lock:
+        text = _detail_yaml_cache.get(key)
+        if text is not None:
+            _detail_yaml_cache.move_to_end(key)
+            return text
+    text = yaml_dump(detail)
+    with _detail_yaml_lock:
+        _detail_yaml_cache[key] = text
+        while len(_detail_yaml_cache) > DETAIL_YAML_CACHE_SIZE:
+            _detail_yaml_cache.popitem(last=False)
+    return text
+
+
+_YAML_METADATA_KEYS = ("name", "namespace", "uid", "resourceVersion", "creationTimestamp")
+
+
+def raw_yaml_detail(text: str) -> dict:
+    """
+    kubectl -o yaml 输出直接作为详情 YAML 返回，不做完整解析；
+    仅逐行提取 apiVersion、kind 及 metadata 下的标量字段
+    """
+    detail = {"metadata": {}, "yaml": text}
+    in_metadata = False
+    for line in text.splitlines():
+        if not line.startswith(" "):
+            in_metadata = line == "metadata:"
+            key, sep, value = line.partition(": ")
+            if sep and key in ("apiVersion", "kind"):
+                detail[key] = value.strip()
+        elif in_metadata and not line.startswith("   "):
+            key, sep, value = line.strip().partition(": ")
+            if sep and key in _YAML_METADATA_KEYS:
+                detail["metadata"][key] = value.strip().strip("\"'")
+    return detail
+
+
 def re_connect_if_disconnect_decorator(func):
     """前置调用装饰器"""
 
@@ -495,74 +830,239 @@ class SshK8sClient:
     def __del__(self):
         self.ssh_client.disconnect()
 
+    def close(self):
+        self.ssh_client.disconnect()
+
     def re_connect_if_disconnect(self, method_name):
-        # print(method_name)
-        res = self.ssh_client.execute_command("echo 'hello world'")
-        if (
-            not res.get("success", False)
-            and res.get("error", "") == "SSH session not active"
-        ):
-            self.ssh_client.connect()
+        # 仅检查 Transport 状态，断开时按退避策略惰性重连，不额外执行探测命令
+        if not self.ssh_client.ensure_connected():
+            raise Exception(
+                f"SSH 连接 {self.ssh_client.hostname} 不可用: {self.ssh_client.last_error}"
+            )
+
+    def connection_stats(self) -> dict:
+        """
+        SSH连接健康状态
+        """
+        return self.ssh_client.stats()
+
+    @property
+    def max_log_streams(self) -> int:
+        """
+        可同时打开的 follow 日志流数量（所有请求共享），每个流占用一个通道
+        """
+        return self.ssh_client.log_streams.limit
+
+    @property
+    def max_parallel_logs(self) -> int:
+        """
+        合并日志时并行获取的日志源数量上限，至少为其他请求保留一个通道
+        """
+        return max(1, self.ssh_client.pool_size - 1)
+
+    def _get_json(self, cmd: str) -> dict:
+        """
+        流式读取 kubectl -o json 输出并解析
+        """
+        stream = self.ssh_client.execute_command_stream(
+            cmd, max_bytes=SSH_LIST_MAX_BYTES, timeout=SSH_LIST_TIMEOUT, raw=True
+        )
+        chunks = []
+        try:
+            while True:
+                chunks.append(next(stream))
+        except StopIteration as stop:
+            status = stop.value
+        if status["truncated"]:
+            raise Exception(f"命令输出超过 {SSH_LIST_MAX_BYTES} 字节: {cmd}")
+        if status["exit_code"]:
+            raise Exception(f"执行 {cmd} 失败: {status['error']}")
+        return json_loads(b"".join(chunks))
+
+    def _get_rows(self, cmd: str, row_func) -> list[dict]:
+        """
+        获取资源列表并转换为与 KUBE 方式一致的行
+        """
+        return [row_func(item) for item in self._get_json(cmd).get("items", [])]
+
+    def _list_rows(
+        self, kind: str, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
+        """
+        kubectl get 列表，选择器通过 -l/--field-selector 交给 API Server 筛选
+        """
+        cmd = f"kubectl get {k8s_rows.RESOURCE_KINDS[kind]['kubectl']} -n {shlex.quote(ns)} -o json"
+        if label_selector:
+            cmd += f" -l {shlex.quote(label_selector)}"
+        if field_selector:
+            cmd += f" --field-selector {shlex.quote(field_selector)}"
+        return self._get_rows(cmd, k8s_rows.RESOURCE_KINDS[kind]["row"])
+
+    def _get_table(self, cmd: str) -> list[dict]:
+        """
+        流式读取 kubectl 表格输出并逐行解析
+        """
+        lines = self.ssh_client.execute_command_stream(
+            cmd, max_bytes=SSH_LIST_MAX_BYTES, timeout=SSH_LIST_TIMEOUT
+        )
+        return convert_lines2map(lines)
 
     @re_connect_if_disconnect_decorator
     def get_namespace(self, ns: str) -> list[dict]:
         """
         获取命名空间
         """
-        result = self.ssh_client.execute_command("kubectl get ns")
-        result = convert2map(result)
+        result = self._get_rows("kubectl get ns -o json", k8s_rows.namespace_row)
         if ns:
             return [next((item for item in result if item["NAME"] == ns), None)]
         return result
 
     @re_connect_if_disconnect_decorator
-    def get_deployments(self, ns: str) -> list[dict]:
+    def get_deployments(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取部署
         """
-        result = self.ssh_client.execute_command(
-            f"kubectl get deployments -n {ns} -o wide"
-        )
-        return convert2map(result)
+        return self._list_rows("deployments", ns, label_selector, field_selector)
 
     @re_connect_if_disconnect_decorator
-    def get_pods(self, ns: str) -> list[dict]:
+    def get_pods(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取Pod
         """
-        result = self.ssh_client.execute_command(f"kubectl get pods -n {ns}")
-        return convert2map(result)
+        return self._list_rows("pods", ns, label_selector, field_selector)
 
     @re_connect_if_disconnect_decorator
-    def get_services(self, ns: str) -> list[dict]:
+    def get_services(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取服务
         """
-        result = self.ssh_client.execute_command(f"kubectl get services -n {ns}")
-        return convert2map(result)
+        return self._list_rows("services", ns, label_selector, field_selector)
+
+    @re_connect_if_disconnect_decorator
+    def get_resources(self, ns: str, kinds: list[str]) -> dict:
+        """
+        一条 kubectl get 命令获取多种资源，再按 kind 拆分为各自的行
+        """
+        kinds_by_json = {k8s_rows.RESOURCE_KINDS[kind]["kind"]: kind for kind in kinds}
+        resources = ",".join(k8s_rows.RESOURCE_KINDS[kind]["kubectl"] for kind in kinds)
+        result = {kind: [] for kind in kinds}
+        for item in self._get_json(f"kubectl get {resources} -n {shlex.quote(ns)} -o json").get(
+            "items", []
+        ):
+            kind = kinds_by_json.get(item.get("kind"))
+            if kind:
+                result[kind].append(k8s_rows.RESOURCE_KINDS[kind]["row"](item))
+        return result
+
+    @re_connect_if_disconnect_decorator
+    def list_page(
+        self,
+        kind: str,
+        ns: str,
+        limit: int,
+        continue_token: str = None,
+        label_selector: str = None,
+        field_selector: str = None,
+    ) -> dict:
+        """
+        通过 kubectl get --raw 调用 API Server 的分页 LIST
+        （kubectl get 的 --chunk-size 只影响内部请求，不会把 continue 令牌交给调用方）
+        """
+        query = {"limit": int(limit)}
+        if continue_token:
+            query["continue"] = continue_token
+        if label_selector:
+            query["labelSelector"] = label_selector
+        if field_selector:
+            query["fieldSelector"] = field_selector
+        # 命名空间作为 URL 路径的一段，转义 / 等字符，避免拼出其他 API 路径
+        path = k8s_rows.RESOURCE_KINDS[kind]["path"].format(ns=quote(ns, safe=""))
+        data = self._get_json(f"kubectl get --raw {shlex.quote(path + '?' + urlencode(query))}")
+        return k8s_rows.page_result(data, kind)
 
     @re_connect_if_disconnect_decorator
     def logs(self, ns: str = None, pods_name: str = None, lines: int = None) -> str:
         args = f"--tail {lines}" if lines else ""
         cmd = f"""kubectl logs {args} -n {ns} {pods_name}"""
-        result = self.ssh_client.execute_command(cmd)
-        return result["output"]
+        chunks = self.ssh_client.execute_command_stream(
+            cmd, max_bytes=SSH_LOGS_MAX_BYTES, raw=True
+        )
+        return b"".join(chunks).decode(errors="replace")
 
     @re_connect_if_disconnect_decorator
-    def get_configmaps(self, ns: str) -> list[dict]:
+    def stream_logs(
+        self,
+        ns: str,
+        pod_name: str,
+        container: str = None,
+        follow: bool = False,
+        lines: int = None,
+        timestamps: bool = False,
+        since_seconds: int = None,
+        since_time: str = None,
+        limit_bytes: int = None,
+        previous: bool = False,
+        idle_timeout: float = None,
+    ):
+        """
+        kubectl logs 流式读取，迭代器关闭时关闭通道，远端 kubectl logs -f 随之结束
+        follow 流需占用日志流名额，名额用完时抛出 StreamLimitError
+        """
+        args = [f"-n {shlex.quote(ns)}", shlex.quote(pod_name)]
+        if container:
+            args.append(f"-c {shlex.quote(container)}")
+        if follow:
+            args.append("-f")
+        if lines is not None:
+            args.append(f"--tail={int(lines)}")
+        if timestamps:
+            args.append("--timestamps")
+        if since_seconds:
+            args.append(f"--since={int(since_seconds)}s")
+        if since_time:
+            args.append(f"--since-time={shlex.quote(since_time)}")
+        if limit_bytes:
+            args.append(f"--limit-bytes={int(limit_bytes)}")
+        if previous:
+            args.append("--previous")
+        if not follow:
+            return self._stream_command(f"kubectl logs {' '.join(args)}", idle_timeout)
+        release = self.ssh_client.log_streams.acquire()
+        return QuotaStream(self._stream_command(f"kubectl logs {' '.join(args)}", idle_timeout), release)
+
+    def _stream_command(self, cmd: str, idle_timeout: float = None):
+        """
+        产出命令的原始输出块，命令失败时在流末尾抛出异常
+        """
+        status = yield from self.ssh_client.execute_command_stream(
+            cmd, raw=True, idle_timeout=idle_timeout
+        )
+        if status["exit_code"]:
+            raise Exception(f"执行 {cmd} 失败: {status['error'].strip()}")
+
+    @re_connect_if_disconnect_decorator
+    def get_configmaps(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取ConfigMap
         """
-        result = self.ssh_client.execute_command(f"kubectl get configmaps -n {ns}")
-        return convert2map(result)
+        return self._list_rows("configmaps", ns, label_selector, field_selector)
 
     @re_connect_if_disconnect_decorator
-    def get_ingresses(self, ns: str) -> list[dict]:
+    def get_ingresses(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> list[dict]:
         """
         获取Ingress
         """
-        result = self.ssh_client.execute_command(f"kubectl get ingress -n {ns}")
-        return convert2map(result)
+        return self._list_rows("ingresses", ns, label_selector, field_selector)
 
     @re_connect_if_disconnect_decorator
     def delete_pod(self, ns: str = None, pod_name: str = None) -> str:
@@ -581,8 +1081,7 @@ class SshK8sClient:
     @re_connect_if_disconnect_decorator
     def get_deployment_images(self, ns: str = None) -> list[dict]:
         shell_cmd = f"""kubectl get deployments -n {ns} -o custom-columns=NAME:.metadata.name,IMAGES:.spec.template.spec.containers[*].image"""
-        result = self.ssh_client.execute_command(shell_cmd)
-        return convert2map(result)
+        return self._get_table(shell_cmd)
 
     @re_connect_if_disconnect_decorator
     def scale_deployment(
@@ -639,6 +1138,15 @@ class SshK8sClient:
             )
         return f"命名空间 {ns} 删除成功"
 
+    @re_connect_if_disconnect_decorator
+    def get_deployment_json(self, deploy_name: str, ns: str) -> dict:
+        """
+        获取Deployment的原始 JSON
+        """
+        return self._get_json(
+            f"kubectl get deployment {shlex.quote(deploy_name)} -n {shlex.quote(ns)} -o json"
+        )
+
     @re_connect_if_disconnect_decorator
     def get_deployment_detail(self, deploy_name: str, ns: str) -> dict:
         """
@@ -653,13 +1161,13 @@ class SshK8sClient:
         result = self.ssh_client.execute_command(
             f"kubectl get deployment {deploy_name} -n {ns} -o yaml"
         )
-        if not result.get("success", False):
+        if not result.get("success", False) or result.get("exit_code"):
+            # 资源不存在等情况 kubectl 以非零退出码结束，错误信息在 stderr 中
             raise Exception(
-                f"获取Deployment {deploy_name} 详情失败: {result.get('error', 'Unknown error')}"
+                f"获取Deployment {deploy_name} 详情失败: {result.get('error', 'Unknown error').strip()}"
             )
 
-        deployment_yaml = yaml.safe_load(result["output"])
-        return deployment_yaml
+        return raw_yaml_detail(result["output"])
 
     @re_connect_if_disconnect_decorator
     def get_service_detail(self, service_name: str, ns: str) -> dict:
@@ -675,13 +1183,12 @@ class SshK8sClient:
         result = self.ssh_client.execute_command(
             f"kubectl get service {service_name} -n {ns} -o yaml"
         )
-        if not result.get("success", False):
+        if not result.get("success", False) or result.get("exit_code"):
             raise Exception(
-                f"获取Service {service_name} 详情失败: {result.get('error', 'Unknown error')}"
+                f"获取Service {service_name} 详情失败: {result.get('error', 'Unknown error').strip()}"
             )
 
-        service_yaml = yaml.safe_load(result["output"])
-        return service_yaml
+        return raw_yaml_detail(result["output"])
 
     @re_connect_if_disconnect_decorator
     def get_configmap_detail(self, configmap_name: str, ns: str) -> dict:
@@ -697,13 +1204,12 @@ class SshK8sClient:
         result = self.ssh_client.execute_command(
             f"kubectl get configmap {configmap_name} -n {ns} -o yaml"
         )
-        if not result.get("success", False):
+        if not result.get("success", False) or result.get("exit_code"):
             raise Exception(
-                f"获取ConfigMap {configmap_name} 详情失败: {result.get('error', 'Unknown error')}"
+                f"获取ConfigMap {configmap_name} 详情失败: {result.get('error', 'Unknown error').strip()}"
             )
 
-        configmap_yaml = yaml.safe_load(result["output"])
-        return configmap_yaml
+        return raw_yaml_detail(result["output"])
 
     @re_connect_if_disconnect_decorator
     def get_ingress_detail(self, ingress_name: str, ns: str) -> dict:
@@ -719,13 +1225,12 @@ class SshK8sClient:
         result = self.ssh_client.execute_command(
             f"kubectl get ingress {ingress_name} -n {ns} -o yaml"
         )
-        if not result.get("success", False):
+        if not result.get("success", False) or result.get("exit_code"):
             raise Exception(
-                f"获取Ingress {ingress_name} 详情失败: {result.get('error', 'Unknown error')}"
+                f"获取Ingress {ingress_name} 详情失败: {result.get('error', 'Unknown error').strip()}"
             )
 
-        ingress_yaml = yaml.safe_load(result["output"])
-        return ingress_yaml
+        return raw_yaml_detail(result["output"])
 
     @re_connect_if_disconnect_decorator
     def delete_deployment(self, deploy_name: str, ns: str) -> str:
@@ -843,27 +1348,35 @@ class SshK8sClient:
         """
         使用kubectl apply创建或更新资源
         """
-        # 创建临时文件
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_file_path = f.name
+        # 清单经 exec 通道的 stdin 传给 kubectl，本地与远端均不落盘
+        result = self.ssh_client.execute_command(
+            f"kubectl apply -f - -n {shlex.quote(ns)}", stdin_data=yaml_content
+        )
+        if not result.get("success", False) or result.get("exit_code"):
+            raise Exception(f"创建资源失败: {result.get('error', 'Unknown error')}")
+        return result["output"]
 
-        try:
-            remote_file_path = (
-                f"/home/temp-{ns}-{datetime.now().strftime('%Y%m%d%H%M%S')}.yaml"
-            )
-            self.ssh_client.upload_file(temp_file_path, remote_file_path)
 
-            # 使用kubectl apply创建Service
-            result = self.ssh_client.execute_command(
-                f"kubectl apply -f {remote_file_path} -n {ns}"
-            )
-            if not result.get("success", False):
-                raise Exception(f"创建资源失败: {result.get('error', 'Unknown error')}")
-            return result["output"]
-        finally:
-            # 清理临时文件
-            os.unlink(temp_file_path)
+class _TimeoutApiClient(k8s_client.ApiClient):
+    """
+    为未显式指定超时的普通请求注入默认超时；
+    流式请求（watch、follow 日志等 _preload_content=False）保持原样，避免长连接被读超时中断
+    """
+
+    def __init__(self, configuration=None, request_timeout=None):
+        super().__init__(configuration)
+        if isinstance(request_timeout, list):
+            request_timeout = tuple(request_timeout)
+        self.request_timeout = request_timeout
+
+    def call_api(self, *args, **kwargs):
+        if (
+            self.request_timeout
+            and kwargs.get("_request_timeout") is None
+            and kwargs.get("_preload_content", True)
+        ):
+            kwargs["_request_timeout"] = self.request_timeout
+        return super().call_api(*args, **kwargs)
 
 
 def switch_kubeconfig_decorator(func):
@@ -883,150 +1396,255 @@ class KubeK8sClient:
     使用官方 kubernetes Python SDK 的客户端实现
     """
 
-    def __init__(self, kube_config=None, namespace: str = "default"):
+    def __init__(
+        self, kube_config=None, namespace: str = "default", kube_options=None, watch_cache=None
+    ):
         self.apps_v1 = None
         self.core_v1 = None
+        self.networking_v1 = None
         self.namespace = namespace
         self.kube_config = kube_config
+        # 连接池大小、默认请求超时、重试次数等 SDK 选项
+        self.kube_options = kube_options or {}
+        # _preload_content=False 的非流式请求（原始 JSON 列表等）不会被 _TimeoutApiClient 注入超时，需显式传入
+        request_timeout = self.kube_options.get("request_timeout")
+        self.request_timeout = tuple(request_timeout) if isinstance(request_timeout, list) else request_timeout
+        # 缓存的 ApiClient 及其对应的 kubeconfig 指纹，指纹不变时复用连接池
+        self.api_client = None
+        self._config_stat = None
+        self._config_digest = None
+        self._config_lock = threading.Lock()
+        # 可选的列表 watch 缓存：true 或 {idle_ttl, watch_timeout, sync_timeout}
+        self.watch_cache = None
+        if watch_cache:
+            options = watch_cache if isinstance(watch_cache, dict) else {}
+            self.watch_cache = WatchCache(self._list_func, list_timeout=self.request_timeout, **options)
+
+    def connection_stats(self) -> dict:
+        """
+        返回配置信息及 ApiClient 缓存状态
+        """
+        return {
+            "kube_config": self.kube_config if isinstance(self.kube_config, str) else None,
+            "api_client_cached": self.api_client is not None,
+            "kube_options": self.kube_options,
+            "watch_cache": self.watch_cache.stats() if self.watch_cache else None,
+        }
+
+    def close(self):
+        """
+        停止 WATCH 并关闭 ApiClient 的线程池和连接池
+        """
+        if self.watch_cache:
+            self.watch_cache.clear()
+        with self._config_lock:
+            api_client = self.api_client
+            self.api_client = None
+            self._config_stat = None
+        if api_client is not None:
+            api_client.close()
+            api_client.rest_client.pool_manager.clear()
 
     def switch_kubeconfig(self, method_name):
-        self._load_config(self.kube_config)
-        self.core_v1 = k8s_client.CoreV1Api()
-        self.apps_v1 = k8s_client.AppsV1Api()
+        """
+        确保 API 对象可用：kubeconfig 未变化时直接复用缓存的 ApiClient，
+        文件 mtime/大小变化且内容摘要不同才重新加载
+        """
+        config_stat = self._stat_config()
+        if self.api_client is not None and config_stat == self._config_stat:
+            return
+        with self._config_lock:
+            if self.api_client is not None and config_stat == self._config_stat:
+                return
+            digest = self._digest_config()
+            if self.api_client is not None and digest == self._config_digest:
+                # 仅 mtime 变化（如 touch、重复写入相同内容），无需重建
+                self._config_stat = config_stat
+                return
+            api_client = self._new_api_client(self.kube_config, self.kube_options)
+            if self.api_client is not None and self.watch_cache:
+                # 集群配置已变化，缓存的数据和 WATCH 连接不再可信
+                self.watch_cache.clear()
+            # 旧 ApiClient 可能仍被进行中的请求使用，不主动关闭，交由 GC 回收
+            self.core_v1 = k8s_client.CoreV1Api(api_client)
+            self.apps_v1 = k8s_client.AppsV1Api(api_client)
+            self.networking_v1 = k8s_client.NetworkingV1Api(api_client)
+            self.api_client = api_client
+            self._config_digest = digest
+            self._config_stat = config_stat
+
+    def _config_paths(self) -> List[str]:
+        """
+        kubeconfig 对应的文件列表，dict 配置返回空列表
+        """
+        if self.kube_config is None:
+            locations = os.environ.get("KUBECONFIG", k8s_config.KUBE_CONFIG_DEFAULT_LOCATION)
+            return [os.path.expanduser(p) for p in locations.split(os.pathsep) if p]
+        if isinstance(self.kube_config, str):
+            return [self.kube_config]
+        return []
+
+    def _stat_config(self):
+        """
+        廉价的文件指纹：(路径, mtime, 大小)，文件不存在时对应项为 None
+        """
+        config_stat = []
+        for path in self._config_paths():
+            try:
+                st = os.stat(path)
+                config_stat.append((path, st.st_mtime_ns, st.st_size))
+            except OSError:
+                config_stat.append((path, None, None))
+        return tuple(config_stat)
+
+    def _digest_config(self) -> str:
+        """
+        kubeconfig 内容摘要，dict 配置按排序后的 JSON 计算
+        """
+        sha = hashlib.sha256()
+        if isinstance(self.kube_config, dict):
+            sha.update(json.dumps(self.kube_config, sort_keys=True, default=str).encode("utf-8"))
+            return sha.hexdigest()
+        for path in self._config_paths():
+            sha.update(path.encode("utf-8"))
+            try:
+                with open(path, "rb") as f:
+                    sha.update(f.read())
+            except OSError:
+                sha.update(b"\0")
+        return sha.hexdigest()
 
     @staticmethod
-    def _load_config(kube_config):
+    def _new_api_client(kube_config, kube_options=None):
         """
+        每个集群使用独立的 Configuration/ApiClient，不修改全局默认配置，
+        多个集群的请求可并发执行且互不影响。
         支持三种方式加载配置：
         1. 未提供 -> 默认搜索 ~/.kube/config
         2. 字符串且是文件路径 -> 从该路径加载
         3. dict -> 直接从 dict 加载
         """
+        kube_options = kube_options or {}
+        configuration = k8s_client.Configuration()
         if kube_config is None:
-            k8s_config.load_kube_config()
-            return
-        if isinstance(kube_config, str) and os.path.exists(kube_config):
-            k8s_config.load_kube_config(config_file=kube_config)
-            return
-        if isinstance(kube_config, dict):
-            k8s_config.load_kube_config_from_dict(kube_config)
-            return
-        raise ValueError("kube_config 应为路径、dict 或 None")
+            k8s_config.load_kube_config(client_configuration=configuration)
+        elif isinstance(kube_config, str) and os.path.exists(kube_config):
+            k8s_config.load_kube_config(config_file=kube_config, client_configuration=configuration)
+        elif isinstance(kube_config, dict):
+            k8s_config.load_kube_config_from_dict(kube_config, client_configuration=configuration)
+        else:
+            raise ValueError("kube_config 应为路径、dict 或 None")
+
+        if kube_options.get("connection_pool_maxsize"):
+            configuration.connection_pool_maxsize = int(kube_options["connection_pool_maxsize"])
+        if kube_options.get("retries") is not None:
+            configuration.retries = int(kube_options["retries"])
+        return _TimeoutApiClient(configuration, request_timeout=kube_options.get("request_timeout"))
 
     # ---------- 通用辅助 ----------
-    @staticmethod
-    def _format_age(creation_timestamp: Optional[datetime]) -> str:
-        if not creation_timestamp:
-            return ""
-        now = datetime.now(timezone.utc)
-        delta = now - creation_timestamp
-        days = delta.days
-        seconds = delta.seconds
-        if days > 0:
-            return f"{days}d"
-        hours = seconds // 3600
-        if hours > 0:
-            return f"{hours}h"
-        minutes = (seconds % 3600) // 60
-        if minutes > 0:
-            return f"{minutes}m"
-        return f"{seconds}s"
+    def _list_func(self, kind: str):
+        """
+        资源类型对应的 SDK list 方法，供 watch 缓存使用
+        """
+        self.switch_kubeconfig("watch")
+        return {
+            "deployments": self.apps_v1.list_namespaced_deployment,
+            "pods": self.core_v1.list_namespaced_pod,
+            "services": self.core_v1.list_namespaced_service,
+            "configmaps": self.core_v1.list_namespaced_config_map,
+            "ingresses": self.networking_v1.list_namespaced_ingress,
+        }[kind]
 
-    @staticmethod
-    def _join_images(containers) -> str:
-        return ",".join([c.image for c in containers]) if containers else ""
+    def _list_raw(self, kind: str, ns: str, **kwargs) -> dict:
+        """
+        LIST 资源并直接解析原始 JSON，跳过 SDK 模型（V1Pod 等）的反序列化
+        """
+        resp = self._list_func(kind)(
+            namespace=ns, _preload_content=False, _request_timeout=self.request_timeout, **kwargs
+        )
+        try:
+            return json_loads(resp.data)
+        finally:
+            resp.release_conn()
+
+    def _get_rows(
+        self, kind: str, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> List[Dict]:
+        """
+        获取列表行：优先读取 watch 缓存，否则直接 LIST，与 SSH 方式共用行转换函数
+        带选择器时直接请求 API Server 筛选，缓存只保存整个命名空间的数据
+        """
+        row = k8s_rows.RESOURCE_KINDS[kind]["row"]
+        items = None
+        if self.watch_cache and not label_selector and not field_selector:
+            items = self.watch_cache.list(kind, ns)
+        if items is None:
+            items = self._list_raw(
+                kind, ns, label_selector=label_selector, field_selector=field_selector
+            ).get("items") or []
+        return [row(obj) for obj in items]
 
     # ---------- 业务方法 ----------
     @switch_kubeconfig_decorator
     def get_namespace(self, ns: str = None) -> List[Dict]:
-        namespaces = self.core_v1.list_namespace().items
-        results = [
-            {
-                "NAME": item.metadata.name,
-                "STATUS": item.status.phase,
-                "AGE": self._format_age(item.metadata.creation_timestamp),
-            }
-            for item in namespaces
-        ]
+        resp = self.core_v1.list_namespace(
+            _preload_content=False, _request_timeout=self.request_timeout
+        )
+        try:
+            namespaces = json_loads(resp.data).get("items") or []
+        finally:
+            resp.release_conn()
+        results = [k8s_rows.namespace_row(item) for item in namespaces]
         if ns:
             return [next((item for item in results if item["NAME"] == ns), None)]
         return results
 
-    @switch_kubeconfig_decorator
-    def get_deployments(self, ns: str) -> List[Dict]:
-        deployments = self.apps_v1.list_namespaced_deployment(ns).items
-        result = []
-        for dep in deployments:
-            desired = dep.spec.replicas or 0
-            ready = dep.status.ready_replicas or 0
-            uptodate = dep.status.updated_replicas or 0
-            available = dep.status.available_replicas or 0
-            result.append(
-                {
-                    "NAME": dep.metadata.name,
-                    "READY": f"{ready}/{desired}",
-                    "UP-TO-DATE": uptodate,
-                    "AVAILABLE": available,
-                    "AGE": self._format_age(dep.metadata.creation_timestamp),
-                    "IMAGES": self._join_images(dep.spec.template.spec.containers),
-                }
-            )
-        return result
+    def get_deployments(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> List[Dict]:
+        return self._get_rows("deployments", ns, label_selector, field_selector)
 
-    @switch_kubeconfig_decorator
-    def get_pods(self, ns: str) -> List[Dict]:
-        pods = self.core_v1.list_namespaced_pod(ns).items
-        result = []
-        for pod in pods:
-            total = len(pod.spec.containers or [])
-            ready = sum(1 for cs in (pod.status.container_statuses or []) if cs.ready)
-            restarts = sum(
-                (cs.restart_count or 0) for cs in (pod.status.container_statuses or [])
-            )
-            result.append(
-                {
-                    "NAME": pod.metadata.name,
-                    "READY": f"{ready}/{total}",
-                    "STATUS": pod.status.phase,
-                    "RESTARTS": restarts,
-                    "AGE": self._format_age(pod.metadata.creation_timestamp),
-                }
-            )
-        return result
+    def get_pods(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> List[Dict]:
+        return self._get_rows("pods", ns, label_selector, field_selector)
 
-    @switch_kubeconfig_decorator
-    def get_services(self, ns: str) -> List[Dict]:
-        services = self.core_v1.list_namespaced_service(ns).items
-        result = []
-        for svc in services:
-            ports = []
-            for p in svc.spec.ports or []:
-                port_str = f"{p.port}"
-                if p.node_port:
-                    port_str = f"{p.port}:{p.node_port}"
-                protocol = p.protocol or "TCP"
-                ports.append(f"{port_str}/{protocol}")
-            external_ip = ""
-            if svc.status.load_balancer and svc.status.load_balancer.ingress:
-                external_ip = (
-                    svc.status.load_balancer.ingress[0].ip
-                    or svc.status.load_balancer.ingress[0].hostname
-                )
-            elif svc.spec.external_i_ps:
-                external_ip = ",".join(svc.spec.external_i_ps)
-            else:
-                external_ip = "None"
-            result.append(
-                {
-                    "NAME": svc.metadata.name,
-                    "TYPE": svc.spec.type,
-                    "CLUSTER-IP": svc.spec.cluster_ip,
-                    "EXTERNAL-IP": external_ip,
-                    "PORTS": ",".join(ports),
-                    "AGE": self._format_age(svc.metadata.creation_timestamp),
-                }
-            )
-        return result
+    def get_services(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> List[Dict]:
+        return self._get_rows("services", ns, label_selector, field_selector)
+
+    def get_resources(self, ns: str, kinds: list[str]) -> dict:
+        """
+        并发获取多种资源的列表
+        """
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            futures = {
+                kind: executor.submit(getattr(self, f"get_{kind}"), ns) for kind in kinds
+            }
+            return {kind: future.result() for kind, future in futures.items()}
+
+    def list_page(
+        self,
+        kind: str,
+        ns: str,
+        limit: int,
+        continue_token: str = None,
+        label_selector: str = None,
+        field_selector: str = None,
+    ) -> dict:
+        """
+        API Server 分页 LIST（limit/continue），直接解析原始 JSON
+        """
+        data = self._list_raw(
+            kind,
+            ns,
+            limit=limit,
+            _continue=continue_token,
+            label_selector=label_selector,
+            field_selector=field_selector,
+        )
+        return k8s_rows.page_result(data, kind)
 
     @switch_kubeconfig_decorator
     def logs(self, ns: str = None, pods_name: str = None, lines: int = None) -> str:
@@ -1037,56 +1655,64 @@ class KubeK8sClient:
         )
 
     @switch_kubeconfig_decorator
-    def get_configmaps(self, ns: str) -> List[Dict]:
+    def stream_logs(
+        self,
+        ns: str,
+        pod_name: str,
+        container: str = None,
+        follow: bool = False,
+        lines: int = None,
+        timestamps: bool = False,
+        since_seconds: int = None,
+        since_time: str = None,
+        limit_bytes: int = None,
+        previous: bool = False,
+        idle_timeout: float = None,
+    ):
+        """
+        read_namespaced_pod_log(_preload_content=False) 流式读取，
+        在后台线程中读取响应，迭代器关闭时关闭 HTTP 连接
+        """
+        if since_time:
+            # SDK 不支持 sinceTime，换算为 sinceSeconds（向上取整，不丢失边界上的日志）
+            elapsed = datetime.now(timezone.utc) - k8s_rows.parse_timestamp(since_time)
+            since_seconds = max(1, math.ceil(elapsed.total_seconds()))
+        resp = self.core_v1.read_namespaced_pod_log(
+            name=pod_name,
+            namespace=ns,
+            container=container,
+            follow=follow,
+            tail_lines=lines,
+            timestamps=timestamps,
+            since_seconds=since_seconds,
+            limit_bytes=limit_bytes,
+            previous=previous,
+            _preload_content=False,
+        )
+
+        def chunks():
+            try:
+                yield from resp.stream(log_stream.LOG_CHUNK_SIZE)
+            finally:
+                resp.release_conn()
+
+        return log_stream.pump(chunks(), lambda: abort_response(resp), idle_timeout)
+
+    def get_configmaps(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> List[Dict]:
         """
         获取ConfigMap
         """
-        configmaps = self.core_v1.list_namespaced_config_map(ns).items
-        result = []
-        for cm in configmaps:
-            result.append(
-                {
-                    "NAME": cm.metadata.name,
-                    "DATA": str(len(cm.data)) if cm.data else "0",
-                    "AGE": self._format_age(cm.metadata.creation_timestamp),
-                }
-            )
-        return result
+        return self._get_rows("configmaps", ns, label_selector, field_selector)
 
-    @switch_kubeconfig_decorator
-    def get_ingresses(self, ns: str) -> List[Dict]:
+    def get_ingresses(
+        self, ns: str, label_selector: str = None, field_selector: str = None
+    ) -> List[Dict]:
         """
         获取Ingress
         """
-        # 需要导入networking v1 API
-        networking_v1 = k8s_client.NetworkingV1Api()
-        ingresses = networking_v1.list_namespaced_ingress(ns).items
-        result = []
-        for ing in ingresses:
-            hosts = []
-            if ing.spec.rules:
-                for rule in ing.spec.rules:
-                    if rule.host:
-                        hosts.append(rule.host)
-            addresses = []
-            if ing.status.load_balancer and ing.status.load_balancer.ingress:
-                for lb_ingress in ing.status.load_balancer.ingress:
-                    if lb_ingress.ip:
-                        addresses.append(lb_ingress.ip)
-                    elif lb_ingress.hostname:
-                        addresses.append(lb_ingress.hostname)
-            result.append(
-                {
-                    "NAME": ing.metadata.name,
-                    "CLASS": (
-                        getattr(ing.spec, "ingress_class_name", "") if ing.spec else ""
-                    ),
-                    "HOSTS": ",".join(hosts) if hosts else "*",
-                    "ADDRESS": ",".join(addresses) if addresses else "",
-                    "AGE": self._format_age(ing.metadata.creation_timestamp),
-                }
-            )
-        return result
+        return self._get_rows("ingresses", ns, label_selector, field_selector)
 
     @switch_kubeconfig_decorator
     def delete_pod(self, ns: str = None, pod_name: str = None) -> str:
@@ -1115,16 +1741,11 @@ class KubeK8sClient:
         )
         return "deployment image updated"
 
-    @switch_kubeconfig_decorator
     def get_deployment_images(self, ns: str = None) -> List[Dict]:
         ns = ns or self.namespace
-        deployments = self.apps_v1.list_namespaced_deployment(ns).items
         return [
-            {
-                "NAME": dep.metadata.name,
-                "IMAGES": self._join_images(dep.spec.template.spec.containers),
-            }
-            for dep in deployments
+            {"NAME": row["NAME"], "IMAGES": row["IMAGES"]}
+            for row in self._get_rows("deployments", ns)
         ]
 
     @switch_kubeconfig_decorator
@@ -1188,6 +1809,22 @@ class KubeK8sClient:
         self.core_v1.delete_namespace(name=ns)
         return f"命名空间 {ns} 删除成功"
 
+    @switch_kubeconfig_decorator
+    def get_deployment_json(self, deploy_name: str, ns: str) -> dict:
+        """
+        获取Deployment的原始 JSON
+        """
+        resp = self.apps_v1.read_namespaced_deployment(
+            name=deploy_name,
+            namespace=ns,
+            _preload_content=False,
+            _request_timeout=self.request_timeout,
+        )
+        try:
+            return json_loads(resp.data)
+        finally:
+            resp.release_conn()
+
     @switch_kubeconfig_decorator
     def get_deployment_detail(self, deploy_name: str, ns: str) -> dict:
         """
@@ -1310,8 +1947,7 @@ class KubeK8sClient:
             raise Exception("namespace 非空")
 
         try:
-            networking_v1 = k8s_client.NetworkingV1Api()
-            ingress = networking_v1.read_namespaced_ingress(
+            ingress = self.networking_v1.read_namespaced_ingress(
                 name=ingress_name, namespace=ns
             )
             # 将Ingress对象转换为字典格式
@@ -1405,8 +2041,7 @@ class KubeK8sClient:
             raise Exception("namespace 非空")
 
         try:
-            networking_v1 = k8s_client.NetworkingV1Api()
-            networking_v1.delete_namespaced_ingress(name=ingress_name, namespace=ns)
+            self.networking_v1.delete_namespaced_ingress(name=ingress_name, namespace=ns)
             return f"Ingress {ingress_name} 删除成功"
         except k8s_client.ApiException as e:
             if e.status == 404:
@@ -1420,7 +2055,7 @@ class KubeK8sClient:
         使用表单数据创建Deployment
         """
         # 构建Deployment对象
-        deployment_dict = yaml.safe_load(deployment_yaml)
+        deployment_dict = yaml_load(deployment_yaml)
         # 确保YAML中的命名空间与请求参数一致
         deployment_dict["metadata"]["namespace"] = ns
 
@@ -1436,7 +2071,7 @@ class KubeK8sClient:
         使用表单数据创建Service
         """
         # 构建Service对象
-        service_dict = yaml.safe_load(service_yaml)
+        service_dict = yaml_load(service_yaml)
 
         # 确保YAML中的命名空间与请求参数一致
         service_dict["metadata"]["namespace"] = ns
@@ -1453,7 +2088,7 @@ class KubeK8sClient:
         使用表单数据创建ConfigMap
         """
         # 构建ConfigMap对象
-        configmap_dict = yaml.safe_load(configmap_yaml)
+        configmap_dict = yaml_load(configmap_yaml)
 
         # 确保YAML中的命名空间与请求参数一致
         configmap_dict["metadata"]["namespace"] = ns
@@ -1470,14 +2105,13 @@ class KubeK8sClient:
         使用表单数据创建Ingress
         """
         # 构建Ingress对象
-        ingress_dict = yaml.safe_load(ingress_yaml)
+        ingress_dict = yaml_load(ingress_yaml)
 
         # 确保YAML中的命名空间与请求参数一致
         ingress_dict["metadata"]["namespace"] = ns
 
         # 创建Ingress
-        networking_v1 = k8s_client.NetworkingV1Api()
-        ingress = networking_v1.create_namespaced_ingress(
+        ingress = self.networking_v1.create_namespaced_ingress(
             namespace=ns, body=ingress_dict
         )
         return f"Ingress {ingress.metadata.name} 创建成功"
@@ -1488,7 +2122,7 @@ class KubeK8sClient:
         从YAML创建资源
         """
         # 判断类型
-        yaml_dict = yaml.safe_load(yaml_content)
+        yaml_dict = yaml_load(yaml_content)
         if yaml_dict["kind"] == "Deployment":
             return self.create_deployment(ns, yaml_content)
         elif yaml_dict["kind"] == "Service":
@@ -0,0 +1,266 @@
+"""
+资源列表行转换
+将 kubectl -o json / API Server 返回的原始 JSON 对象转换为前端表格使用的行字典，
+SSH 与 KUBE 两种方式共用，保证同一资源返回的字段一致
+"""
+from datetime import datetime, timezone
+
+try:
+    # orjson 为可选依赖，解析大列表时明显快于标准库
+    import orjson
+
+    def json_loads(data):
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def json_loads(data):
+        return json.loads(data)
+
+
+class ParamError(ValueError):
+    """
+    请求参数错误（接口返回 400），与配置错误、解析错误等其他 ValueError 区分
+    """
+
+
+def parse_timestamp(value):
+    """
+    解析 RFC3339 时间（如 2024-01-01T00:00:00Z），已是 datetime 时原样返回
+    """
+    if not value or isinstance(value, datetime):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def format_age(creation_timestamp) -> str:
+    creation_timestamp = parse_timestamp(creation_timestamp)
+    if not creation_timestamp:
+        return ""
+    delta = datetime.now(timezone.utc) - creation_timestamp
+    days = delta.days
+    seconds = delta.seconds
+    if days > 0:
+        return f"{days}d"
+    hours = seconds // 3600
+    if hours > 0:
+        return f"{hours}h"
+    minutes = (seconds % 3600) // 60
+    if minutes > 0:
+        return f"{minutes}m"
+    return f"{seconds}s"
+
+
+def _age(obj: dict) -> str:
+    return format_age(obj.get("metadata", {}).get("creationTimestamp"))
+
+
+def namespace_row(obj: dict) -> dict:
+    return {
+        "NAME": obj["metadata"]["name"],
+        "STATUS": (obj.get("status") or {}).get("phase", ""),
+        "AGE": _age(obj),
+    }
+
+
+def deployment_row(obj: dict) -> dict:
+    spec = obj.get("spec") or {}
+    status = obj.get("status") or {}
+    containers = (((spec.get("template") or {}).get("spec")) or {}).get("containers") or []
+    return {
+        "NAME": obj["metadata"]["name"],
+        "READY": f"{status.get('readyReplicas') or 0}/{spec.get('replicas') or 0}",
+        "UP_TO_DATE": status.get("updatedReplicas") or 0,
+        "AVAILABLE": status.get("availableReplicas") or 0,
+        "AGE": _age(obj),
+        "IMAGES": ",".join(c.get("image", "") for c in containers),
+    }
+
+
+def pod_status(obj: dict) -> str:
+    """
+    与 kubectl get pods 的 STATUS 列保持一致：优先展示容器等待/终止原因，而非仅 phase
+    """
+    status = obj.get("status") or {}
+    reason = status.get("reason") or status.get("phase") or ""
+
+    init_statuses = status.get("initContainerStatuses") or []
+    initializing = False
+    for i, cs in enumerate(init_statuses):
+        state = cs.get("state") or {}
+        terminated = state.get("terminated")
+        waiting = state.get("waiting")
+        if terminated and terminated.get("exitCode") == 0:
+            continue
+        initializing = True
+        if terminated:
+            reason = "Init:" + (terminated.get("reason") or f"ExitCode:{terminated.get('exitCode')}")
+        elif waiting and waiting.get("reason") and waiting["reason"] != "PodInitializing":
+            reason = "Init:" + waiting["reason"]
+        else:
+            reason = f"Init:{i}/{len(init_statuses)}"
+        break
+
+    if not initializing:
+        has_running = False
+        for cs in reversed(status.get("containerStatuses") or []):
+            state = cs.get("state") or {}
+            if (state.get("waiting") or {}).get("reason"):
+                reason = state["waiting"]["reason"]
+            elif (state.get("terminated") or {}).get("reason"):
+                reason = state["terminated"]["reason"]
+            elif state.get("running") and cs.get("ready"):
+                has_running = True
+        if reason == "Completed" and has_running:
+            reason = "Running"
+
+    if obj.get("metadata", {}).get("deletionTimestamp"):
+        reason = "Terminating"
+    return reason
+
+
+def pod_row(obj: dict) -> dict:
+    spec = obj.get("spec") or {}
+    statuses = (obj.get("status") or {}).get("containerStatuses") or []
+    return {
+        "NAME": obj["metadata"]["name"],
+        "READY": f"{sum(1 for cs in statuses if cs.get('ready'))}/{len(spec.get('containers') or [])}",
+        "STATUS": pod_status(obj),
+        "RESTARTS": sum(cs.get("restartCount") or 0 for cs in statuses),
+        "AGE": _age(obj),
+    }
+
+
+def service_row(obj: dict) -> dict:
+    spec = obj.get("spec") or {}
+    status = obj.get("status") or {}
+    ports = []
+    for p in spec.get("ports") or []:
+        port_str = f"{p.get('port')}"
+        if p.get("nodePort"):
+            port_str = f"{p['port']}:{p['nodePort']}"
+        ports.append(f"{port_str}/{p.get('protocol') or 'TCP'}")
+    lb_ingress = (status.get("loadBalancer") or {}).get("ingress") or []
+    if lb_ingress:
+        external_ip = lb_ingress[0].get("ip") or lb_ingress[0].get("hostname")
+    elif spec.get("externalIPs"):
+        external_ip = ",".join(spec["externalIPs"])
+    else:
+        external_ip = "None"
+    return {
+        "NAME": obj["metadata"]["name"],
+        "TYPE": spec.get("type"),
+        "CLUSTER_IP": spec.get("clusterIP"),
+        "EXTERNAL_IP": external_ip,
+        "PORTS": ",".join(ports),
+        "AGE": _age(obj),
+    }
+
+
+def configmap_row(obj: dict) -> dict:
+    return {
+        "NAME": obj["metadata"]["name"],
+        "DATA": str(len(obj.get("data") or {}) + len(obj.get("binaryData") or {})),
+        "AGE": _age(obj),
+    }
+
+
+def ingress_row(obj: dict) -> dict:
+    spec = obj.get("spec") or {}
+    hosts = [rule["host"] for rule in spec.get("rules") or [] if rule.get("host")]
+    addresses = []
+    for lb_ingress in ((obj.get("status") or {}).get("loadBalancer") or {}).get("ingress") or []:
+        if lb_ingress.get("ip"):
+            addresses.append(lb_ingress["ip"])
+        elif lb_ingress.get("hostname"):
+            addresses.append(lb_ingress["hostname"])
+    return {
+        "NAME": obj["metadata"]["name"],
+        "CLASS": spec.get("ingressClassName") or "",
+        "HOSTS": ",".join(hosts) if hosts else "*",
+        "ADDRESS": ",".join(addresses),
+        "AGE": _age(obj),
+    }
+
+
+# 列表接口支持的资源类型：kubectl 资源名、JSON 中的 kind、API 路径以及行转换函数
+RESOURCE_KINDS = {
+    "deployments": {
+        "kubectl": "deployments",
+        "kind": "Deployment",
+        "path": "/apis/apps/v1/namespaces/{ns}/deployments",
+        "row": deployment_row,
+    },
+    "pods": {
+        "kubectl": "pods",
+        "kind": "Pod",
+        "path": "/api/v1/namespaces/{ns}/pods",
+        "row": pod_row,
+    },
+    "services": {
+        "kubectl": "services",
+        "kind": "Service",
+        "path": "/api/v1/namespaces/{ns}/services",
+        "row": service_row,
+    },
+    "configmaps": {
+        "kubectl": "configmaps",
+        "kind": "ConfigMap",
+        "path": "/api/v1/namespaces/{ns}/configmaps",
+        "row": configmap_row,
+    },
+    "ingresses": {
+        "kubectl": "ingresses",
+        "kind": "Ingress",
+        "path": "/apis/networking.k8s.io/v1/namespaces/{ns}/ingresses",
+        "row": ingress_row,
+    },
+}
+
+
+def check_kinds(kinds) -> list:
+    """
+    校验资源类型，未指定时返回全部类型
+    """
+    if not kinds:
+        return list(RESOURCE_KINDS)
+    unknown = [kind for kind in kinds if kind not in RESOURCE_KINDS]
+    if unknown:
+        raise ParamError(f"不支持的资源类型: {','.join(unknown)}")
+    return list(dict.fromkeys(kinds))
+
+
+def selector_string(selector: dict) -> str:
+    """
+    将 LabelSelector（matchLabels + matchExpressions）转换为 labelSelector 查询字符串
+    """
+    terms = [f"{key}={value}" for key, value in (selector.get("matchLabels") or {}).items()]
+    for expr in selector.get("matchExpressions") or []:
+        key = expr["key"]
+        operator = expr.get("operator")
+        values = ",".join(expr.get("values") or [])
+        if operator == "In":
+            terms.append(f"{key} in ({values})")
+        elif operator == "NotIn":
+            terms.append(f"{key} notin ({values})")
+        elif operator == "Exists":
+            terms.append(key)
+        elif operator == "DoesNotExist":
+            terms.append(f"!{key}")
+        else:
+            raise ValueError(f"不支持的 selector operator: {operator}")
+    return ",".join(terms)
+
+
+def page_result(data: dict, kind: str) -> dict:
+    """
+    将分页 LIST 的原始响应转换为 {"items": 行列表, "continue": 下一页令牌}
+    """
+    row = RESOURCE_KINDS[kind]["row"]
+    return {
+        "items": [row(item) for item in data.get("items") or []],
+        "continue": (data.get("metadata") or {}).get("continue") or None,
+    }
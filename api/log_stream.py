@@ -0,0 +1,337 @@
+"""
+日志流处理
+将 SSH / KUBE 两种方式返回的原始日志字节块转换为逐行文本、SSE 事件或 gzip 压缩流，
+并支持将多个带时间戳的日志源按时间合并。
+日志源在产出 b"" 时表示一段时间内没有新输出，可借此发送心跳并及时发现客户端断开
+"""
+import codecs
+import heapq
+import queue
+import tempfile
+import threading
+import time
+import zlib
+
+# 日志读取块大小
+LOG_CHUNK_SIZE = 32 * 1024
+# follow 模式下无输出时发送心跳的间隔（秒）
+LOG_HEARTBEAT_INTERVAL = 15
+# 后台读取线程与消费方之间的队列长度（块数），消费方慢时阻塞读取，内存占用有上限
+PUMP_QUEUE_SIZE = 64
+# 实时合并时每个日志源缓冲的行数上限
+MERGE_QUEUE_SIZE = 256
+# 实时合并时等待较慢日志源的时间窗口（秒），超过后先输出已到达的最早一行
+MERGE_WINDOW = 1.0
+# 非实时合并时每个日志源在内存中缓冲的字节数上限，超出部分写入临时文件
+SPOOL_MAX_MEMORY = 256 * 1024
+
+_END = object()
+
+
+def pump(chunks, close, idle_timeout=None, maxsize=PUMP_QUEUE_SIZE):
+    """
+    在后台线程中读取 chunks 并放入有界队列
+    :param close: 消费方提前结束（如客户端断开）时调用，用于中断阻塞中的读取并释放连接
+    :param idle_timeout: 超过该秒数没有数据时产出 b""，None 表示一直等待
+    """
+    buffer = queue.Queue(maxsize)
+    stop_event = threading.Event()
+
+    def put(item):
+        while not stop_event.is_set():
+            try:
+                buffer.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(_END)
+        except Exception as e:
+            if not stop_event.is_set():
+                put(e)
+
+    threading.Thread(target=run, daemon=True, name="log-pump").start()
+    try:
+        while True:
+            try:
+                item = buffer.get(timeout=idle_timeout)
+            except queue.Empty:
+                yield b""
+                continue
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop_event.set()
+        close()
+
+
+def iter_lines(chunks):
+    """
+    将字节块按 UTF-8 增量解码并切分为行（不含换行符），空块原样以 None 透传作为心跳
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    for chunk in chunks:
+        if not chunk:
+            yield None
+            continue
+        pending += decoder.decode(chunk)
+        if "\n" in pending:
+            lines = pending.split("\n")
+            pending = lines.pop()
+            yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _sse(data: str, event: str = None) -> str:
+    message = f"event: {event}\n" if event else ""
+    for line in data.split("\n"):
+        message += f"data: {line}\n"
+    return message + "\n"
+
+
+def sse_events(chunks):
+    """
+    将日志块转换为 SSE 事件：每行一条 data 消息，空闲时发送注释心跳，
+    结束时发送 end 事件，读取出错时发送 error 事件
+    """
+    return sse_lines(iter_lines(chunks), chunks)
+
+
+def sse_lines(lines, source=None):
+    """
+    将逐行日志（None 表示心跳）转换为 SSE 事件，结束或客户端断开时关闭 lines 及 source
+    """
+    try:
+        for line in lines:
+            if line is None:
+                yield ": ping\n\n"
+            else:
+                yield _sse(line.rstrip("\r"))
+        yield _sse("", "end")
+    except Exception as e:
+        yield _sse(str(e), "error")
+    finally:
+        # 客户端断开时关闭日志源，释放 SSH 通道或 HTTP 连接
+        for iterator in (lines, source):
+            if hasattr(iterator, "close"):
+                iterator.close()
+
+
+def prefetch(chunks):
+    """
+    预先读取第一个非空块后返回等价的迭代器：日志源失败（Pod 不存在、参数错误等）时
+    在发送响应头之前抛出异常，而不是返回 200 后中途截断
+    """
+    first = []
+    try:
+        for chunk in chunks:
+            if chunk:
+                first.append(chunk)
+                break
+    except BaseException:
+        if hasattr(chunks, "close"):
+            chunks.close()
+        raise
+
+    def resume():
+        try:
+            yield from first
+            yield from chunks
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+    return resume()
+
+
+def gzip_chunks(chunks, level=6):
+    """
+    将日志块流式压缩为 gzip 格式，边读边压缩，不在内存中保留完整日志
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    try:
+        for chunk in chunks:
+            if not chunk:
+                continue
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+
+
+def log_sort_key(line: str) -> str:
+    """
+    带时间戳日志行（timestamps=true，RFC3339Nano UTC）的排序键：
+    秒以下部分补齐 9 位，使省略末尾 0 的时间戳也能按字符串正确比较
+    """
+    timestamp = line.split(" ", 1)[0]
+    if not timestamp.endswith("Z"):
+        return timestamp
+    seconds, _, fraction = timestamp[:-1].partition(".")
+    return f"{seconds}.{fraction.ljust(9, '0')}"
+
+
+def tag_lines(tag: str, chunks):
+    """
+    将日志块切分为 (排序键, "[tag] 行") 元组，心跳原样以 None 透传
+    """
+    for line in iter_lines(chunks):
+        if line is None:
+            yield None
+        elif line:
+            yield log_sort_key(line), f"[{tag}] {line.rstrip(chr(13))}"
+
+
+def error_line(tag: str, error) -> tuple:
+    """
+    日志源出错时的提示行，排序键为空串，合并时排在最前
+    """
+    return "", f"[{tag}] 读取日志失败: {error}"
+
+
+def failed_source(error):
+    """
+    无法打开的日志源：迭代时抛出原始异常，由合并逻辑转换为错误行
+    """
+    raise error
+    yield
+
+
+def spool_chunks(chunks):
+    """
+    读取全部日志块并缓冲到临时文件（不超过 SPOOL_MAX_MEMORY 时保留在内存中），
+    返回已回到开头的文件对象，读取过程中不占用与日志大小成正比的内存
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    try:
+        for chunk in chunks:
+            if chunk:
+                spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+    spool.seek(0)
+    return spool
+
+
+def spooled_lines(tag: str, spool):
+    """
+    从 spool_chunks 返回的文件中逐块读取并切分为 (排序键, "[tag] 行")，读完或关闭时关闭文件
+    """
+    try:
+        for item in tag_lines(tag, iter(lambda: spool.read(LOG_CHUNK_SIZE), b"")):
+            if item is not None:
+                yield item
+    finally:
+        spool.close()
+
+
+def merge_sorted(sources):
+    """
+    合并多个已按时间排序的 (排序键, 行) 序列，惰性产出合并后的行；结束或关闭时关闭各序列
+    """
+    try:
+        for _, line in heapq.merge(*sources, key=lambda item: item[0]):
+            yield line
+    finally:
+        for source in sources:
+            if hasattr(source, "close"):
+                source.close()
+
+
+def merge_live(streams, idle_timeout=None, window=MERGE_WINDOW, maxsize=MERGE_QUEUE_SIZE):
+    """
+    实时合并多个持续输出的日志源（k 路归并）
+    每个日志源在后台线程中读取并放入有界队列；所有日志源都有待输出行时输出最早的一行，
+    某个日志源暂无输出时最多等待 window 秒，之后先输出已到达的行，保证实时性
+    :param streams: [(标记, 字节块迭代器)]，迭代器需定期产出 b"" 以便及时响应关闭
+    :param idle_timeout: 超过该秒数没有输出时产出 None 作为心跳
+    """
+    ready = threading.Event()
+    stop_event = threading.Event()
+    queues = [queue.Queue(maxsize) for _ in streams]
+
+    def put(q, item):
+        while not stop_event.is_set():
+            try:
+                q.put(item, timeout=1)
+                ready.set()
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def run(q, tag, chunks):
+        try:
+            for item in tag_lines(tag, chunks):
+                if stop_event.is_set():
+                    return
+                if item is not None and not put(q, item):
+                    return
+        except Exception as e:
+            # 单个日志源出错只输出一行错误信息，不影响其他日志源
+            put(q, error_line(tag, e))
+        finally:
+            put(q, _END)
+            if hasattr(chunks, "close"):
+                chunks.close()
+
+    for q, (tag, chunks) in zip(queues, streams):
+        threading.Thread(target=run, args=(q, tag, chunks), daemon=True, name="log-merge").start()
+
+    heads = {}
+    active = set(range(len(queues)))
+    last_output = time.monotonic()
+    try:
+        while active or heads:
+            ready.clear()
+            for i in list(active):
+                if i in heads:
+                    continue
+                try:
+                    item = queues[i].get_nowait()
+                except queue.Empty:
+                    continue
+                if item is _END:
+                    active.discard(i)
+                else:
+                    heads[i] = (item[0], item[1], time.monotonic())
+            now = time.monotonic()
+            if heads:
+                first = min(heads, key=lambda i: heads[i][0])
+                waited = now - heads[first][2]
+                if all(i in heads for i in active) or waited >= window:
+                    yield heads.pop(first)[1]
+                    last_output = now
+                    continue
+                timeout = window - waited
+            elif not active:
+                break
+            else:
+                timeout = idle_timeout
+            if idle_timeout is not None:
+                if now - last_output >= idle_timeout:
+                    yield None
+                    last_output = now
+                timeout = min(timeout, idle_timeout) if timeout is not None else idle_timeout
+            ready.wait(timeout)
+    finally:
+        stop_event.set()
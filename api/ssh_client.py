@@ -1,70 +1,664 @@
+import codecs
 import paramiko
 import logging
+import shlex
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+# 单个集群默认允许的并发 exec 通道数，需小于服务端 sshd 的 MaxSessions（默认10）
+DEFAULT_MAX_CHANNELS = 8
+# Transport 层 keepalive 间隔（秒）
+DEFAULT_KEEPALIVE_INTERVAL = 30
+# 后台健康检查间隔（秒）
+DEFAULT_HEALTH_CHECK_INTERVAL = 15
+# 重连退避的上限（秒）
+DEFAULT_MAX_BACKOFF = 300
+# 会话模式下单条命令的超时（秒）
+DEFAULT_SESSION_TIMEOUT = 120
+# 流式读取时单次 recv 的字节数
+DEFAULT_STREAM_CHUNK_SIZE = 32768
+# 等待空闲通道的超时（秒），通道池占满时请求最多等待该时长，不会无限阻塞
+DEFAULT_CHANNEL_WAIT_TIMEOUT = 30
+# 建立连接的超时（秒），分别用于 TCP 连接、SSH 握手和认证，避免不可达主机长时间阻塞
+DEFAULT_CONNECT_TIMEOUT = 10
+
+
+class StreamLimitError(Exception):
+    """
+    长时间运行的流（如 kubectl logs -f）数量已达上限
+    """
+
+
+class StreamQuota:
+    """
+    长时间占用通道的流的数量上限
+    每个 follow 日志流在浏览器窗口关闭前一直占用一个通道，需低于通道总数，
+    保证普通命令始终有通道可用；名额用完时立即失败，不排队等待
+    """
+
+    def __init__(self, limit):
+        self.limit = max(1, int(limit))
+        self._lock = threading.Lock()
+        self._in_use = 0
+
+    @property
+    def in_use(self):
+        return self._in_use
+
+    def acquire(self, count=1):
+        """
+        占用 count 个名额，不足时抛出 StreamLimitError
+        :return: 归还名额的函数，可重复调用
+        """
+        with self._lock:
+            if self._in_use + count > self.limit:
+                raise StreamLimitError(
+                    f"实时日志流已达上限（{self._in_use}/{self.limit}），请关闭其他日志窗口后重试"
+                )
+            self._in_use += count
+        released = []
+
+        def release():
+            with self._lock:
+                if not released:
+                    released.append(True)
+                    self._in_use -= count
+
+        return release
+
+
+class QuotaStream:
+    """
+    持有流名额的迭代器，迭代结束、出错或被关闭（包括未开始迭代即被丢弃）时归还名额
+    """
+
+    def __init__(self, chunks, release):
+        self._chunks = chunks
+        self._release = release
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        self._release()
+        self._chunks.close()
+
+    def __del__(self):
+        self._release()
+
+
+class ChannelPool:
+    """
+    基于单个已认证 Transport 的 exec 通道池
+    同一集群的并发请求各自占用一个通道，超过上限时排队等待
+    """
+
+    def __init__(self, transport, max_channels=DEFAULT_MAX_CHANNELS):
+        if max_channels < 1:
+            raise ValueError("max_channels 必须大于0")
+        self.transport = transport
+        self.max_channels = max_channels
+        self._slots = threading.BoundedSemaphore(max_channels)
+        self._lock = threading.Lock()
+        self._in_use = 0
+
+    @property
+    def in_use(self):
+        return self._in_use
+
+    @contextmanager
+    def channel(self, timeout=None):
+        """
+        占用一个通道槽位并打开 session 通道，退出时关闭通道并归还槽位
+        :param timeout: 等待槽位及打开通道的超时秒数，None 表示一直等待
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"等待可用SSH通道超时（{timeout}s），{self.max_channels} 个通道均被占用")
+        chan = None
+        try:
+            if self.transport is None or not self.transport.is_active():
+                raise paramiko.SSHException("SSH session not active")
+            chan = self.transport.open_session(timeout=timeout)
+            with self._lock:
+                self._in_use += 1
+            yield chan
+        finally:
+            if chan is not None:
+                chan.close()
+                with self._lock:
+                    self._in_use -= 1
+            self._slots.release()
+
+
+def load_private_key(key_path, passphrase=None):
+    """
+    加载私钥文件，自动识别 Ed25519 / ECDSA / RSA 格式
+    """
+    if isinstance(passphrase, str):
+        passphrase = passphrase.encode()
+    return paramiko.PKey.from_path(key_path, passphrase=passphrase)
+
+
+def _connect_kwargs(host):
+    """根据主机配置生成 paramiko.SSHClient.connect 的认证参数"""
+    connect_timeout = float(host.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT))
+    kwargs = {
+        "hostname": host["hostname"],
+        "port": int(host.get("port", 22)),
+        "username": host["username"],
+        "timeout": connect_timeout,
+        "banner_timeout": connect_timeout,
+        "auth_timeout": connect_timeout,
+    }
+    if host.get("key_path"):
+        kwargs["pkey"] = load_private_key(host["key_path"], host.get("key_passphrase"))
+    else:
+        kwargs["password"] = host.get("password")
+    return kwargs
+
+
+class JumpTransportCache:
+    """
+    跳板机 Transport 缓存
+    按跳板链路复用已认证的上游连接：同一跳板后的多个集群共享前几跳，
+    只需在最后一跳上为各自目标打开 direct-tcpip 通道
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._key_locks = {}
+
+    @staticmethod
+    def _hop_key(host):
+        return (
+            host["hostname"],
+            int(host.get("port", 22)),
+            host["username"],
+            host.get("key_path"),
+        )
+
+    def _chain_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_transport(self, hops):
+        """
+        获取到跳板链路最后一跳的已认证 Transport，链路上失效的连接会被重建
+        :param hops: 跳板主机配置列表，按连接顺序排列
+        """
+        key = tuple(self._hop_key(host) for host in hops)
+        with self._chain_lock(key):
+            client = self._clients.get(key)
+            if client is not None:
+                transport = client.get_transport()
+                if transport is not None and transport.is_active():
+                    return transport
+                client.close()
+
+            sock = None
+            if len(hops) > 1:
+                sock = self.open_channel(hops[:-1], hops[-1])
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(sock=sock, **_connect_kwargs(hops[-1]))
+            self._clients[key] = client
+            logging.getLogger(__name__).info(f"已连接跳板机 {hops[-1]['hostname']}")
+            return client.get_transport()
+
+    def open_channel(self, hops, target):
+        """
+        经跳板链路打开到目标主机 SSH 端口的 direct-tcpip 通道
+        使用目标主机的 connect_timeout，目标不可达时跳板机迟迟不应答也不会长时间阻塞
+        """
+        transport = self.get_transport(hops)
+        return transport.open_channel(
+            "direct-tcpip",
+            (target["hostname"], int(target.get("port", 22))),
+            ("127.0.0.1", 0),
+            timeout=float(target.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)),
+        )
+
+    def close_all(self):
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+# 进程内共享的跳板机连接
+jump_transports = JumpTransportCache()
+
+
+class ShellSession:
+    """
+    常驻远程 shell 会话
+    命令写入 shell 的 stdin，stdout/stderr 以哨兵标记分隔每条命令的输出及退出码，
+    省去每条命令的通道建立与 shell 启动开销。同一时刻只执行一条命令。
+    """
+
+    def __init__(self, transport, timeout=DEFAULT_SESSION_TIMEOUT):
+        self.transport = transport
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.marker = f"__KUBEYUN_{uuid.uuid4().hex}__".encode()
+        self.chan = transport.open_session(timeout=timeout)
+        self.chan.exec_command("/bin/sh")
+        self._stdout = self.chan.makefile("rb")
+        self._stderr = self.chan.makefile_stderr("rb")
+
+    def is_active(self):
+        return (
+            self.transport.is_active()
+            and not self.chan.closed
+            and not self.chan.exit_status_ready()
+        )
+
+    def run(self, command):
+        """
+        在会话中执行命令，调用方需持有 lock
+        命令在子 shell 中 eval，语法错误或 exit 不会终止常驻 shell；stdin 重定向到 /dev/null
+        """
+        marker = self.marker.decode()
+        script = (
+            f"( eval {shlex.quote(command)} ) </dev/null\n"
+            f"printf '\\n%s %d\\n' {marker} $?\n"
+            f"printf '\\n%s\\n' {marker} >&2\n"
+        )
+        self.chan.settimeout(self.timeout)
+        self.chan.sendall(script.encode())
+        output, exit_code = self._read_until_marker(self._stdout)
+        error, _ = self._read_until_marker(self._stderr)
+        return {
+            "success": True,
+            "output": output.decode(),
+            "error": error.decode(),
+            "exit_code": exit_code,
+        }
+
+    def _read_until_marker(self, stream):
+        chunks = []
+        while True:
+            line = stream.readline()
+            if not line:
+                raise paramiko.SSHException("shell 会话已关闭")
+            if line.startswith(self.marker):
+                rest = line[len(self.marker):].strip()
+                # 去掉哨兵前补充的换行
+                data = b"".join(chunks)[:-1]
+                return data, int(rest) if rest else None
+            chunks.append(line)
+
+    def close(self):
+        self.chan.close()
 
 
 class SSHClient:
-    def __init__(self, hostname, username, password=None, key_path=None, port=22):
+    def __init__(
+        self,
+        hostname,
+        username,
+        password=None,
+        key_path=None,
+        port=22,
+        max_channels=DEFAULT_MAX_CHANNELS,
+        keepalive_interval=DEFAULT_KEEPALIVE_INTERVAL,
+        health_check_interval=DEFAULT_HEALTH_CHECK_INTERVAL,
+        max_backoff=DEFAULT_MAX_BACKOFF,
+        session_mode=False,
+        session_timeout=DEFAULT_SESSION_TIMEOUT,
+        jump_hosts=None,
+        key_passphrase=None,
+        connect_timeout=DEFAULT_CONNECT_TIMEOUT,
+        channel_wait_timeout=DEFAULT_CHANNEL_WAIT_TIMEOUT,
+        max_log_streams=None,
+    ):
         self.hostname = hostname
         self.port = port
         self.username = username
         self.password = password
         self.key_path = key_path
+        self.key_passphrase = key_passphrase
+        # 跳板机链路，按连接顺序排列，每项格式与目标主机相同
+        self.jump_hosts = jump_hosts or []
+        self.max_channels = int(max_channels)
+        self.keepalive_interval = int(keepalive_interval)
+        self.health_check_interval = float(health_check_interval)
+        self.max_backoff = float(max_backoff)
+        self.session_mode = bool(session_mode)
+        self.session_timeout = float(session_timeout)
+        self.connect_timeout = float(connect_timeout)
+        self.channel_wait_timeout = float(channel_wait_timeout)
+        # follow 日志流上限：默认通道数的一半，且至少为普通命令保留一个通道
+        pool_size = self.pool_size
+        if max_log_streams is None:
+            max_log_streams = pool_size // 2
+        self.log_streams = StreamQuota(min(int(max_log_streams), max(1, pool_size - 1)))
         self.client = None
         self.sftp = None
+        self.pool = None
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._sftp_lock = threading.RLock()
+
+        # 连接健康状态
+        self._conn_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._monitor = None
+        self._ever_connected = False
+        self._consecutive_failures = 0
+        self._next_retry_at = 0.0
+        self.connect_count = 0
+        self.reconnect_count = 0
+        self.failure_count = 0
+        self.last_connected_at = None
+        self.last_error = None
 
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def pool_size(self):
+        """exec 通道池大小，会话模式下预留一个通道给常驻 shell"""
+        if self.session_mode:
+            return max(1, self.max_channels - 1)
+        return self.max_channels
+
     def connect(self):
         """建立SSH连接"""
+        with self._conn_lock:
+            connected = self._connect()
+        self._start_monitor()
+        return connected
+
+    def _connect(self):
+        """建立SSH连接，调用方需持有 _conn_lock"""
+        self._close_client()
         try:
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
-            if self.key_path:
-                key = paramiko.RSAKey.from_private_key_file(self.key_path)
-                self.client.connect(
-                    hostname=self.hostname,
-                    port=self.port,
-                    username=self.username,
-                    pkey=key,
-                )
-            else:
-                self.client.connect(
-                    hostname=self.hostname,
-                    port=self.port,
-                    username=self.username,
-                    password=self.password,
+            sock = None
+            if self.jump_hosts:
+                sock = jump_transports.open_channel(
+                    self.jump_hosts,
+                    {
+                        "hostname": self.hostname,
+                        "port": self.port,
+                        "connect_timeout": self.connect_timeout,
+                    },
                 )
+            self.client.connect(
+                sock=sock,
+                **_connect_kwargs(
+                    {
+                        "hostname": self.hostname,
+                        "port": self.port,
+                        "username": self.username,
+                        "password": self.password,
+                        "key_path": self.key_path,
+                        "key_passphrase": self.key_passphrase,
+                        "connect_timeout": self.connect_timeout,
+                    }
+                ),
+            )
 
+            transport = self.client.get_transport()
+            if self.keepalive_interval > 0:
+                transport.set_keepalive(self.keepalive_interval)
+            # 所有 exec 通道复用同一个已认证的 Transport
+            self.pool = ChannelPool(transport, self.pool_size)
+
+            if self._ever_connected:
+                self.reconnect_count += 1
+            self._ever_connected = True
+            self.connect_count += 1
+            self._consecutive_failures = 0
+            self._next_retry_at = 0.0
+            self.last_connected_at = time.time()
             self.logger.info(f"成功连接到 {self.hostname}")
             return True
 
         except Exception as e:
-            self.logger.error(f"连接失败: {e}")
+            self.failure_count += 1
+            self._consecutive_failures += 1
+            # 指数退避：1s, 2s, 4s ... 直至 max_backoff
+            backoff = min(self.max_backoff, 2 ** (self._consecutive_failures - 1))
+            self._next_retry_at = time.time() + backoff
+            self.last_error = str(e)
+            self.logger.error(f"连接失败: {e}，{backoff:.0f}s 后可重试")
             return False
 
-    def execute_command(self, command):
-        """执行单个命令"""
+    def is_active(self):
+        """Transport 是否仍然存活"""
+        transport = self.client.get_transport() if self.client else None
+        return transport is not None and transport.is_active()
+
+    def ensure_connected(self):
+        """
+        连接断开时按退避策略惰性重连
+        :return: 当前连接是否可用
+        """
+        if self.is_active():
+            return True
+        with self._conn_lock:
+            # 其他线程可能已完成重连
+            if self.is_active():
+                return True
+            if time.time() < self._next_retry_at:
+                return False
+            self.logger.warning(f"与 {self.hostname} 的连接已断开，尝试重连")
+            return self._connect()
+
+    def _start_monitor(self):
+        """启动后台健康检查线程"""
+        if self.health_check_interval <= 0 or self._monitor is not None:
+            return
+        self._stop_event = threading.Event()
+        self._monitor = threading.Thread(
+            target=self._monitor_loop,
+            args=(self._stop_event,),
+            name=f"ssh-monitor-{self.hostname}",
+            daemon=True,
+        )
+        self._monitor.start()
+
+    def _monitor_loop(self, stop_event):
+        while not stop_event.wait(self.health_check_interval):
+            try:
+                self.ensure_connected()
+            except Exception as e:
+                self.logger.error(f"健康检查失败: {e}")
+
+    def stats(self):
+        """连接健康状态及计数，用于监控"""
+        return {
+            "hostname": self.hostname,
+            "active": self.is_active(),
+            "channels_in_use": self.pool.in_use if self.pool else 0,
+            "max_channels": self.max_channels,
+            "log_streams_in_use": self.log_streams.in_use,
+            "max_log_streams": self.log_streams.limit,
+            "session_mode": self.session_mode,
+            "session_active": bool(self._session and self._session.is_active()),
+            "connect_count": self.connect_count,
+            "reconnect_count": self.reconnect_count,
+            "failure_count": self.failure_count,
+            "consecutive_failures": self._consecutive_failures,
+            "next_retry_at": self._next_retry_at or None,
+            "last_connected_at": self.last_connected_at,
+            "last_error": self.last_error,
+        }
+
+    def _run_in_session(self, command):
+        """
+        尝试在常驻 shell 会话中执行命令
+        会话正被其他线程占用时返回 None，由调用方改走独立 exec 通道
+        """
+        session = self._session
+        if session is None or not session.is_active():
+            with self._session_lock:
+                session = self._session
+                if session is None or not session.is_active():
+                    if self.pool is None:
+                        return None
+                    session = ShellSession(self.pool.transport, self.session_timeout)
+                    self._session = session
+        if not session.lock.acquire(blocking=False):
+            return None
         try:
-            stdin, stdout, stderr = self.client.exec_command(command)
-            output = stdout.read().decode()
-            error = stderr.read().decode()
+            return session.run(command)
+        except Exception as e:
+            # 命令可能已执行，不能再重试；会话状态已不可知，丢弃后由下次调用重建
+            self.logger.warning(f"shell 会话执行失败: {e!r}")
+            session.close()
+            if self._session is session:
+                self._session = None
+            return {"success": False, "error": f"shell 会话执行失败: {e!r}"}
+        finally:
+            session.lock.release()
+
+    def execute_command(self, command, stdin_data=None):
+        """
+        执行单个命令
+        :param stdin_data: 写入远端命令 stdin 的内容，写完后关闭 stdin（如 kubectl apply -f -）
+        """
+        # 常驻会话的 stdin 被 shell 占用，需要写 stdin 的命令走独立 exec 通道
+        if self.session_mode and stdin_data is None:
+            try:
+                result = self._run_in_session(command)
+            except Exception as e:
+                self.logger.warning(f"打开 shell 会话失败: {e}")
+                result = None
+            if result is not None:
+                return result
+        try:
+            if self.pool is None:
+                raise paramiko.SSHException("SSH session not active")
+            with self.pool.channel(timeout=self.channel_wait_timeout) as chan:
+                chan.exec_command(command)
+                if stdin_data is not None:
+                    if isinstance(stdin_data, str):
+                        stdin_data = stdin_data.encode()
+                    chan.sendall(stdin_data)
+                    chan.shutdown_write()
+                output = chan.makefile("rb").read().decode()
+                error = chan.makefile_stderr("rb").read().decode()
+
+                return {
+                    "success": True,
+                    "output": output,
+                    "error": error,
+                    "exit_code": chan.recv_exit_status(),
+                }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
+    def execute_command_stream(
+        self,
+        command,
+        max_bytes=None,
+        timeout=None,
+        raw=False,
+        chunk_size=DEFAULT_STREAM_CHUNK_SIZE,
+        idle_timeout=None,
+    ):
+        """
+        流式执行命令，边接收边产出 stdout，不在内存中缓存完整输出
+        调用方关闭生成器（如 HTTP 客户端断开）时关闭通道，远端进程随之结束
+        :param max_bytes: 最多读取的字节数，超出后截断并关闭通道
+        :param timeout: 整体超时秒数，超时抛出 TimeoutError；等待空闲通道超时同样抛出 TimeoutError
+        :param raw: True 时产出原始 bytes 块，否则产出解码后的行（保留换行符）
+        :param idle_timeout: 超过该秒数无输出时产出空块（b"" 或 ""），用于 kubectl logs -f 等长时间命令发送心跳
+        :return: 生成器，结束时的返回值为 {"exit_code", "error", "truncated"}
+        """
+        if self.pool is None:
+            raise paramiko.SSHException("SSH session not active")
+        deadline = time.monotonic() + timeout if timeout else None
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        received = 0
+        truncated = False
+        pending = ""
+        with self.pool.channel(timeout=self.channel_wait_timeout) as chan:
+            chan.exec_command(command)
+            chan.settimeout(idle_timeout)
+            while True:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"命令执行超时: {command}")
+                    chan.settimeout(min(remaining, idle_timeout) if idle_timeout else remaining)
+                try:
+                    data = chan.recv(chunk_size)
+                except TimeoutError:
+                    if idle_timeout and (deadline is None or time.monotonic() < deadline):
+                        yield b"" if raw else ""
+                        continue
+                    raise TimeoutError(f"命令执行超时: {command}")
+                if not data:
+                    break
+                if max_bytes is not None and received + len(data) > max_bytes:
+                    data = data[: max_bytes - received]
+                    truncated = True
+                received += len(data)
+                if raw:
+                    if data:
+                        yield data
+                else:
+                    pending += decoder.decode(data)
+                    if "\n" in pending:
+                        lines = pending.split("\n")
+                        pending = lines.pop()
+                        for line in lines:
+                            yield line + "\n"
+                if truncated:
+                    break
+            if not raw:
+                pending += decoder.decode(b"", final=True)
+                if pending:
+                    yield pending
+
+            if truncated:
+                # 提前结束时不再等待远端退出，关闭通道即终止远端进程
+                return {"exit_code": None, "error": "", "truncated": True}
+            chan.settimeout(None)
+            error = chan.makefile_stderr("rb").read().decode(errors="replace")
             return {
-                "success": True,
-                "output": output,
+                "exit_code": chan.recv_exit_status(),
                 "error": error,
-                "exit_code": stdout.channel.recv_exit_status(),
+                "truncated": False,
             }
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+
+    def get_sftp(self):
+        """
+        获取当前连接上缓存的SFTP会话，连接重建或会话失效后重新打开
+        """
+        with self._sftp_lock:
+            transport = self.client.get_transport() if self.client else None
+            if transport is None or not transport.is_active():
+                raise paramiko.SSHException("SSH session not active")
+            sftp = self.sftp
+            if sftp is None or sftp.sock.closed or sftp.sock.get_transport() is not transport:
+                sftp = self.client.open_sftp()
+                self.sftp = sftp
+            return sftp
 
     def upload_file(self, local_path, remote_path):
         """上传文件"""
         try:
-            self.sftp = self.client.open_sftp()
-            self.sftp.put(local_path, remote_path)
+            sftp = self.get_sftp()
+            with self._sftp_lock:
+                sftp.put(local_path, remote_path)
             self.logger.info(f"成功上传文件 {local_path} 到 {remote_path}")
             return True
         except Exception as e:
@@ -74,8 +668,9 @@ class SSHClient:
     def remove_file(self, remote_path):
         """删除远程文件"""
         try:
-            self.sftp = self.client.open_sftp()
-            self.sftp.remove(remote_path)
+            sftp = self.get_sftp()
+            with self._sftp_lock:
+                sftp.remove(remote_path)
             self.logger.info(f"成功删除远程文件 {remote_path}")
             return True
         except Exception as e:
@@ -86,8 +681,9 @@ class SSHClient:
         """上传并执行本地脚本"""
         try:
             # 上传脚本
-            self.sftp = self.client.open_sftp()
-            self.sftp.put(local_script_path, remote_path)
+            sftp = self.get_sftp()
+            with self._sftp_lock:
+                sftp.put(local_script_path, remote_path)
 
             # 设置权限
             self.execute_command(f"chmod +x {remote_path}")
@@ -103,12 +699,28 @@ class SSHClient:
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def disconnect(self):
-        """断开连接"""
+    def _close_client(self):
+        """关闭当前连接及其上的SFTP会话和shell会话"""
+        if self._session:
+            self._session.close()
+            self._session = None
         if self.sftp:
-            self.sftp.close()
+            try:
+                self.sftp.close()
+            except Exception:
+                pass
+            self.sftp = None
         if self.client:
             self.client.close()
+            self.client = None
+        self.pool = None
+
+    def disconnect(self):
+        """断开连接"""
+        self._stop_event.set()
+        self._monitor = None
+        with self._conn_lock:
+            self._close_client()
         self.logger.info(f"已断开与 {self.hostname} 的连接")
 
 
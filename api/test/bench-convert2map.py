@@ -0,0 +1,81 @@
+# convert2map 解析性能基准
+# 生成 10k / 50k 行的 kubectl get pods -o wide 风格表格，对比旧的 split/index 实现与按列偏移解析的实现
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from k8s_client_svc import convert_lines2map
+
+# 每个规模重复次数，取最快一次
+repeat = 3
+
+header = ["NAME", "READY", "STATUS", "RESTARTS", "AGE", "IP", "NODE", "NOMINATED NODE", "READINESS GATES"]
+statuses = ["Running", "Pending", "CrashLoopBackOff", "Completed"]
+
+
+def build_table(rows):
+    """按 kubectl tabwriter 的方式（列宽取最大值并补 3 个空格）生成表格"""
+    data = [header]
+    for i in range(rows):
+        data.append([
+            f"svc-{i % 97}-deployment-{i:08x}-{i % 7}x{i % 13}",
+            f"{i % 2}/1",
+            statuses[i % len(statuses)],
+            f"{i % 5} ({i % 59}m ago)" if i % 5 else "0",
+            f"{i % 30}d",
+            f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            f"node-{i % 40}",
+            "<none>",
+            "<none>",
+        ])
+    widths = [max(len(row[c]) for row in data) + 3 for c in range(len(header))]
+    return [
+        "".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() + "\n"
+        for row in data
+    ]
+
+
+def legacy_convert2map(lines):
+    """改写前的实现：每个字段都重新 split 整行并 index 表头"""
+    lines = iter(lines)
+    header_line = next(lines, None)
+    if header_line is None:
+        return []
+    fields = header_line.split()
+    ns_list = []
+    for line in lines:
+        ns_item = {}
+        for field in fields:
+            field_name = str(field).replace("-", "_")
+            if field_name.__contains__("PORT"):
+                field_name = "PORTS"
+            if len(line.split()) > fields.index(field):
+                ns_item[field_name] = line.split()[fields.index(field)]
+        ns_list.append(ns_item)
+    return ns_list
+
+
+def bench(func, lines):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(iter(lines))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+if __name__ == "__main__":
+    for rows in (10_000, 50_000):
+        table = build_table(rows)
+        legacy_time, _ = bench(legacy_convert2map, table)
+        new_time, parsed = bench(convert_lines2map, table)
+        assert len(parsed) == rows
+        assert parsed[-1]["NOMINATED_NODE"] == "<none>"
+        print(
+            f"{rows:>6} 行: 旧实现 {legacy_time * 1000:8.1f} ms, "
+            f"新实现 {new_time * 1000:8.1f} ms, 提升 {legacy_time / new_time:4.1f}x"
+        )
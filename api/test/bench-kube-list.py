@@ -0,0 +1,113 @@
+# KUBE 方式 Pod 列表解析性能基准
+# 生成 1k / 5k 个 Pod 的 PodList JSON，对比 SDK 反序列化为 V1Pod 再取字段与直接解析原始 JSON 的 CPU 耗时
+import json
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from kubernetes import client as k8s_client
+
+import k8s_rows
+from k8s_rows import json_loads
+
+# 每个规模重复次数，取最快一次
+repeat = 3
+
+
+def build_pod_list(count):
+    """生成接近真实大小的 PodList（含 labels、env、probe、容器状态等字段）"""
+    items = []
+    for i in range(count):
+        name = f"svc-{i % 97}-deployment-{i:08x}"
+        items.append({
+            "metadata": {
+                "name": name,
+                "namespace": "default",
+                "uid": f"00000000-0000-0000-0000-{i:012d}",
+                "resourceVersion": str(100000 + i),
+                "creationTimestamp": "2024-01-01T00:00:00Z",
+                "labels": {"app": f"svc-{i % 97}", "pod-template-hash": f"{i:08x}"},
+                "ownerReferences": [{
+                    "apiVersion": "apps/v1", "kind": "ReplicaSet", "name": f"svc-{i % 97}-{i:08x}",
+                    "uid": f"11111111-0000-0000-0000-{i:012d}", "controller": True,
+                }],
+            },
+            "spec": {
+                "nodeName": f"node-{i % 40}",
+                "containers": [{
+                    "name": "app",
+                    "image": f"registry.example.com/svc-{i % 97}:1.{i % 10}.0",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "env": [{"name": f"ENV_{k}", "value": f"value-{k}"} for k in range(8)],
+                    "resources": {"limits": {"cpu": "1", "memory": "1Gi"}, "requests": {"cpu": "100m", "memory": "128Mi"}},
+                    "readinessProbe": {"httpGet": {"path": "/health", "port": 8080}, "periodSeconds": 10},
+                }],
+            },
+            "status": {
+                "phase": "Running",
+                "podIP": f"10.0.{i // 256 % 256}.{i % 256}",
+                "startTime": "2024-01-01T00:00:05Z",
+                "conditions": [
+                    {"type": t, "status": "True", "lastTransitionTime": "2024-01-01T00:00:10Z"}
+                    for t in ("Initialized", "Ready", "ContainersReady", "PodScheduled")
+                ],
+                "containerStatuses": [{
+                    "name": "app", "ready": i % 3 != 0, "restartCount": i % 5,
+                    "image": f"registry.example.com/svc-{i % 97}:1.{i % 10}.0",
+                    "imageID": f"registry.example.com/svc@sha256:{i:064x}",
+                    "containerID": f"containerd://{i:064x}",
+                    "state": {"running": {"startedAt": "2024-01-01T00:00:08Z"}},
+                }],
+            },
+        })
+    return json.dumps({"kind": "PodList", "apiVersion": "v1", "metadata": {"resourceVersion": "1"}, "items": items}).encode()
+
+
+def sdk_rows(api_client, data):
+    """改写前的实现：SDK 反序列化为 V1PodList 后逐个读取字段"""
+    pods = api_client.deserialize(SimpleNamespace(data=data), "V1PodList").items
+    result = []
+    for pod in pods:
+        statuses = pod.status.container_statuses or []
+        result.append({
+            "NAME": pod.metadata.name,
+            "READY": f"{sum(1 for cs in statuses if cs.ready)}/{len(pod.spec.containers or [])}",
+            "STATUS": pod.status.phase,
+            "RESTARTS": sum((cs.restart_count or 0) for cs in statuses),
+            "AGE": k8s_rows.format_age(pod.metadata.creation_timestamp),
+        })
+    return result
+
+
+def raw_rows(data):
+    """当前实现：_preload_content=False 拿到原始字节后直接解析"""
+    return [k8s_rows.pod_row(item) for item in json_loads(data)["items"]]
+
+
+def bench(func, *args):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.process_time()
+        result = func(*args)
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+if __name__ == "__main__":
+    api_client = k8s_client.ApiClient()
+    for count in (1_000, 5_000):
+        data = build_pod_list(count)
+        sdk_time, sdk_result = bench(sdk_rows, api_client, data)
+        raw_time, raw_result = bench(raw_rows, data)
+        assert [r["NAME"] for r in sdk_result] == [r["NAME"] for r in raw_result]
+        print(
+            f"{count:>5} 个 Pod ({len(data) / 1024 / 1024:.1f} MB): "
+            f"SDK 反序列化 {sdk_time * 1000 / count * 1000:7.1f} ms/1k, "
+            f"原始 JSON {raw_time * 1000 / count * 1000:6.1f} ms/1k, "
+            f"提升 {sdk_time / raw_time:4.1f}x"
+        )
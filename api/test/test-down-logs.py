@@ -17,20 +17,15 @@ ns_server_info = json.loads(os.environ.get("ssh-xxx-env"))
 client = K8sClientSvc(namespace=name_space, ssh_config=ns_server_info)
 
 try:
-    pods = client.get_pods()
+    # 按 deployment 的 selector 在服务端筛选 pods
+    pods = client.get_deployment_pods(deploy_name)
     if len(pods) == 0:
-        print("获取pods失败")
-        exit(1)
-    pods_name = None
-    for pod in pods:
-        if str(pod.get('NAME')).startswith(deploy_name):
-            pods_name = pod.get('NAME')
-    if not pods_name:
         print("获取pods失败 deploy=" + deploy_name)
         exit(1)
-    result = client.logs(pod_name=pods_name, lines=lines)
-    # 将日志输出到文件
-    with open(f"{logs_dir}/{deploy_name}.log", "w", encoding="utf-8") as file:
-        file.write(result)
+    pods_name = pods[-1].get('NAME')
+    # 边读取边写入文件，不在内存中拼接完整日志
+    with open(f"{logs_dir}/{deploy_name}.log", "wb") as file:
+        for chunk in client.stream_logs(pod_name=pods_name, lines=lines):
+            file.write(chunk)
 finally:
     print('success!')
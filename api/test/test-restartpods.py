@@ -14,17 +14,12 @@ ns_server_info = json.loads(os.environ.get("ssh-xxx-env"))
 client = K8sClientSvc(namespace=name_space, ssh_config=ns_server_info)
 
 try:
-    pods = client.get_pods()
+    # 按 deployment 的 selector 在服务端筛选 pods
+    pods = client.get_deployment_pods(deploy_name)
     if len(pods) == 0:
-        print("获取pods失败")
-        exit(1)
-    pods_name = None
-    for pod in pods:
-        if str(pod.get('NAME')).startswith(deploy_name):
-            pods_name = pod.get('NAME')
-    if not pods_name:
         print("获取pods失败 deploy=" + deploy_name)
         exit(1)
+    pods_name = pods[-1].get('NAME')
     print("pods名称 【", pods_name, "】")
     result = client.delete_pod(pods_name)
     print("重启pods成功")
@@ -0,0 +1,272 @@
+"""
+列表资源的 watch 缓存（informer 模式）
+每个 (资源类型, 命名空间) 首次被访问时先 LIST 一次，再从返回的 resourceVersion 开始 WATCH，
+资源变更增量应用到内存中的原始 JSON 对象；WATCH 过期（410 Gone）时重新 LIST。
+列表接口直接读取内存数据，长时间无人访问的命名空间会自动停止 WATCH 并释放
+"""
+import socket
+import threading
+import time
+
+from kubernetes.client.rest import ApiException
+from kubernetes.watch.watch import iter_resp_lines
+
+from k8s_rows import json_loads
+
+# 命名空间无人访问多久后停止 WATCH（秒）
+DEFAULT_IDLE_TTL = 600
+# 单次 WATCH 请求的服务端超时（秒），到期后从最新 resourceVersion 重新发起
+DEFAULT_WATCH_TIMEOUT = 300
+# WATCH 读超时比服务端超时多出的余量（秒）：连接被 NAT/负载均衡静默丢弃时，读取不会一直阻塞
+WATCH_READ_TIMEOUT_MARGIN = 30
+# 首次访问时等待初始 LIST 完成的时长（秒）
+DEFAULT_SYNC_TIMEOUT = 30
+# WATCH/LIST 失败后的最大重试间隔（秒）
+MAX_RETRY_BACKOFF = 30
+
+HTTP_STATUS_GONE = 410
+
+
+def abort_response(resp):
+    """
+    中断其他线程正在阻塞读取的流式 HTTP 响应（WATCH、follow 日志）
+    resp.close() 需等待读取线程释放缓冲区锁，没有新数据到达时会一直阻塞；
+    直接关闭底层 socket 的读写，读取线程随即返回并自行关闭响应
+    """
+    sock = getattr(getattr(resp, "connection", None), "sock", None)
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class _ResourceGone(Exception):
+    """
+    resourceVersion 已过期，需要重新 LIST
+    """
+
+
+class _Informer:
+    """
+    单个 (资源类型, 命名空间) 的 LIST + WATCH 循环，在后台线程中运行
+    """
+
+    def __init__(self, kind, namespace, resolve, idle_ttl, watch_timeout, list_timeout, on_exit):
+        self.kind = kind
+        self.namespace = namespace
+        self._resolve = resolve
+        self._list_timeout = list_timeout
+        self._idle_ttl = idle_ttl
+        self._watch_timeout = watch_timeout
+        self._on_exit = on_exit
+        # 名称 -> 原始 JSON 对象
+        self._items = {}
+        self._lock = threading.Lock()
+        self.resource_version = None
+        self.last_error = None
+        self.last_access = time.monotonic()
+        # 数据可用（已完成 LIST 且 WATCH 未中断）
+        self.synced = threading.Event()
+        # 首次 LIST 已结束（无论成功与否），用于避免读取方在失败时长时间等待
+        self.first_attempt = threading.Event()
+        self._stop_event = threading.Event()
+        self._resp = None
+        self._thread = threading.Thread(
+            target=self._run, daemon=True, name=f"watch-{kind}-{namespace}"
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        resp = self._resp
+        if resp is not None:
+            # 关闭连接以唤醒阻塞在读取上的 WATCH
+            abort_response(resp)
+
+    def items(self) -> list:
+        self.last_access = time.monotonic()
+        with self._lock:
+            return [self._items[name] for name in sorted(self._items)]
+
+    def stats(self) -> dict:
+        return {
+            "items": len(self._items),
+            "synced": self.synced.is_set(),
+            "resource_version": self.resource_version,
+            "idle": round(time.monotonic() - self.last_access, 1),
+            "last_error": str(self.last_error) if self.last_error else None,
+        }
+
+    def _idle(self) -> bool:
+        return time.monotonic() - self.last_access > self._idle_ttl
+
+    def _run(self):
+        backoff = 1
+        need_list = True
+        try:
+            while not self._stop_event.is_set() and not self._idle():
+                try:
+                    if need_list:
+                        self._list()
+                        need_list = False
+                    self._watch()
+                    backoff = 1
+                except _ResourceGone:
+                    need_list = True
+                except Exception as e:
+                    if self._stop_event.is_set():
+                        break
+                    if isinstance(e, ApiException) and e.status == HTTP_STATUS_GONE:
+                        need_list = True
+                        continue
+                    # 数据可能已过期，读取方回退为直接请求，直到重新 LIST 成功
+                    self.last_error = e
+                    self.synced.clear()
+                    self.first_attempt.set()
+                    need_list = True
+                    self._stop_event.wait(backoff)
+                    backoff = min(MAX_RETRY_BACKOFF, backoff * 2)
+        finally:
+            self.synced.clear()
+            self.first_attempt.set()
+            self._on_exit(self)
+
+    def _list(self):
+        resp = self._resolve(self.kind)(
+            namespace=self.namespace, _preload_content=False, _request_timeout=self._list_timeout
+        )
+        try:
+            data = json_loads(resp.data)
+        finally:
+            resp.release_conn()
+        items = {obj["metadata"]["name"]: obj for obj in data.get("items") or []}
+        with self._lock:
+            self._items = items
+            self.resource_version = data["metadata"]["resourceVersion"]
+        self.last_error = None
+        self.synced.set()
+        self.first_attempt.set()
+
+    def _watch_request_timeout(self):
+        """
+        WATCH 请求的客户端超时 (连接超时, 读超时)，连接超时沿用 LIST 的设置
+        """
+        connect_timeout = self._list_timeout
+        if isinstance(connect_timeout, (tuple, list)):
+            connect_timeout = connect_timeout[0]
+        return connect_timeout, self._watch_timeout + WATCH_READ_TIMEOUT_MARGIN
+
+    def _watch(self):
+        resp = self._resolve(self.kind)(
+            namespace=self.namespace,
+            watch=True,
+            resource_version=self.resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=self._watch_timeout,
+            _preload_content=False,
+            _request_timeout=self._watch_request_timeout(),
+        )
+        self._resp = resp
+        try:
+            for line in iter_resp_lines(resp):
+                if self._stop_event.is_set() or self._idle():
+                    return
+                if not line:
+                    continue
+                event = json_loads(line)
+                event_type = event.get("type")
+                obj = event.get("object") or {}
+                if event_type == "ERROR":
+                    if obj.get("code") == HTTP_STATUS_GONE:
+                        raise _ResourceGone()
+                    raise ApiException(
+                        status=obj.get("code"),
+                        reason=f"{obj.get('reason')}: {obj.get('message')}",
+                    )
+                metadata = obj.get("metadata") or {}
+                with self._lock:
+                    if event_type in ("ADDED", "MODIFIED"):
+                        self._items[metadata["name"]] = obj
+                    elif event_type == "DELETED":
+                        self._items.pop(metadata["name"], None)
+                    if metadata.get("resourceVersion"):
+                        self.resource_version = metadata["resourceVersion"]
+        finally:
+            self._resp = None
+            resp.close()
+            resp.release_conn()
+
+
+class WatchCache:
+    """
+    按 (资源类型, 命名空间) 管理 informer
+    resolve(kind) 返回对应的 SDK list 方法（如 CoreV1Api.list_namespaced_pod），
+    每次 LIST/WATCH 时重新获取，kubeconfig 变化后自动使用新的 ApiClient。
+    list_timeout 为 LIST 请求的超时（SDK _request_timeout 格式），WATCH 由服务端 timeout_seconds 控制，
+    客户端读超时略大于 timeout_seconds，连接失效时 WATCH 报错并重新 LIST
+    """
+
+    def __init__(
+        self,
+        resolve,
+        idle_ttl=DEFAULT_IDLE_TTL,
+        watch_timeout=DEFAULT_WATCH_TIMEOUT,
+        sync_timeout=DEFAULT_SYNC_TIMEOUT,
+        list_timeout=None,
+    ):
+        self._resolve = resolve
+        self.idle_ttl = idle_ttl
+        self.watch_timeout = watch_timeout
+        self.sync_timeout = sync_timeout
+        self.list_timeout = list_timeout
+        self._informers = {}
+        self._lock = threading.Lock()
+
+    def list(self, kind: str, ns: str):
+        """
+        返回缓存中的原始对象列表（按名称排序）
+        缓存尚未同步或同步失败时返回 None，调用方应回退为直接请求
+        """
+        with self._lock:
+            informer = self._informers.get((kind, ns))
+            if informer is None:
+                informer = _Informer(
+                    kind,
+                    ns,
+                    self._resolve,
+                    self.idle_ttl,
+                    self.watch_timeout,
+                    self.list_timeout,
+                    self._remove,
+                )
+                self._informers[(kind, ns)] = informer
+                informer.start()
+        informer.last_access = time.monotonic()
+        informer.first_attempt.wait(self.sync_timeout)
+        if not informer.synced.is_set():
+            return None
+        return informer.items()
+
+    def _remove(self, informer):
+        with self._lock:
+            if self._informers.get((informer.kind, informer.namespace)) is informer:
+                del self._informers[(informer.kind, informer.namespace)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            informers = list(self._informers.values())
+        return {f"{i.kind}/{i.namespace}": i.stats() for i in informers}
+
+    def clear(self):
+        """
+        停止全部 WATCH 并清空缓存
+        """
+        with self._lock:
+            informers = list(self._informers.values())
+            self._informers.clear()
+        for informer in informers:
+            informer.stop()
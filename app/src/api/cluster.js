@@ -32,8 +32,11 @@ export const getIngressDetail = (clusterId, ingressName, namespace) =>
 export const getServices = (clusterId, namespace) => 
   api.get(`/clusters/${clusterId}/services`, { params: { namespace } })
 
-export const getPods = (clusterId, namespace) => 
-  api.get(`/clusters/${clusterId}/pods`, { params: { namespace } })
+export const getPods = (clusterId, namespace, labelSelector, fieldSelector) => 
+  api.get(`/clusters/${clusterId}/pods`, { params: { namespace, labelSelector, fieldSelector } })
+
+export const getDeploymentPods = (clusterId, deploymentName, namespace) =>
+  api.get(`/clusters/${clusterId}/deployments/${deploymentName}/pods`, { params: { namespace } })
 
 export const getConfigmaps = (clusterId, namespace) =>
   api.get(`/clusters/${clusterId}/configmaps`, { params: { namespace } })
@@ -41,6 +44,13 @@ export const getConfigmaps = (clusterId, namespace) =>
 export const getIngresses = (clusterId, namespace) =>
   api.get(`/clusters/${clusterId}/ingresses`, { params: { namespace } })
 
+// 分页获取资源列表，返回 { items, continue }，continue 为空表示最后一页
+export const getResourcePage = (clusterId, kind, namespace, limit, continueToken) =>
+  api.get(`/clusters/${clusterId}/${kind}`, { params: { namespace, limit, continue: continueToken } })
+
+export const getResources = (clusterId, namespace, kinds) =>
+  api.get(`/clusters/${clusterId}/resources`, { params: { namespace, kinds: kinds && kinds.join(',') } })
+
 export const updateDeploymentImage = (clusterId, deploymentName, image, namespace) =>
   api.post(`/clusters/${clusterId}/deployments/${deploymentName}/update-image`, 
     { image }, 
@@ -62,6 +72,32 @@ export const deleteConfigMap = (clusterId, configMapName, namespace) =>
 export const deleteIngress = (clusterId, ingressName, namespace) =>
   api.delete(`/clusters/${clusterId}/ingresses/${ingressName}`, { params: { namespace } })
 
+// 流式日志（SSE）地址，配合 EventSource 使用：每行一条 message，结束时收到 end 事件，出错时收到 error 事件
+export const getPodLogStreamUrl = (clusterId, podName, namespace, { lines, follow = true, container, timestamps } = {}) => {
+  const params = new URLSearchParams({ namespace, follow })
+  if (lines) params.append('lines', lines)
+  if (container) params.append('container', container)
+  if (timestamps) params.append('timestamps', timestamps)
+  return `/api/clusters/${clusterId}/pods/${podName}/logs/stream?${params}`
+}
+
+// gzip 日志下载地址，可选 container、sinceSeconds、sinceTime、limitBytes、previous、timestamps
+export const getPodLogDownloadUrl = (clusterId, podName, namespace, options = {}) => {
+  const params = new URLSearchParams({ namespace })
+  Object.entries(options).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') params.append(key, value)
+  })
+  return `/api/clusters/${clusterId}/pods/${podName}/logs/download?${params}`
+}
+
+// Deployment 合并日志（SSE）地址，每行以 [pod/container] 开头并按时间排序
+export const getDeploymentLogStreamUrl = (clusterId, deploymentName, namespace, { lines, follow = true, sinceSeconds } = {}) => {
+  const params = new URLSearchParams({ namespace, follow })
+  if (lines) params.append('lines', lines)
+  if (sinceSeconds) params.append('sinceSeconds', sinceSeconds)
+  return `/api/clusters/${clusterId}/deployments/${deploymentName}/logs/stream?${params}`
+}
+
 export const getPodLogs = (clusterId, podName, namespace, lines) =>
   api.get(`/clusters/${clusterId}/pods/${podName}/logs`, { 
     params: { namespace, lines } 
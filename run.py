@@ -1,9 +1,82 @@
 """
 启动文件
 用于启动后端 API 服务
+
+开发模式：python run.py
+生产模式：python run.py --production
+    使用 gunicorn 预派生多个 worker 进程，每个进程内多线程处理请求。
+    不预加载应用：每个 worker 在 fork 之后各自导入 api.app 并创建集群客户端，
+    SSH 连接和 HTTP 连接池不会在进程间共享；worker 退出时关闭全部连接
 """
-from api.app import app
+import argparse
+import os
+import sys
+
+
+def run_dev(host, port):
+    from api.app import app
+
+    app.run(debug=True, host=host, port=port)
+
+
+def worker_exit(server, worker):
+    """
+    gunicorn worker 退出（包括收到 SIGTERM 优雅退出）时关闭集群连接
+    """
+    app_module = sys.modules.get('api.app')
+    if app_module is not None:
+        app_module.close_clients()
+
+
+def run_production(bind, workers, threads, timeout):
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise SystemExit("生产模式需要安装 gunicorn: pip install gunicorn")
+
+    class ProductionApplication(BaseApplication):
+
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            # 在 worker 进程中执行
+            from api.app import app
+
+            return app
+
+    ProductionApplication({
+        'bind': bind,
+        'workers': workers,
+        # gthread：每个 worker 多线程，SSE 日志流等长连接各占用一个线程
+        'worker_class': 'gthread',
+        'threads': threads,
+        'timeout': timeout,
+        'preload_app': False,
+        'worker_exit': worker_exit,
+        'accesslog': '-',
+    }).run()
+
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    parser = argparse.ArgumentParser(description="启动后端 API 服务")
+    parser.add_argument('--production', action='store_true', help="使用 gunicorn 多进程模式启动")
+    parser.add_argument('--host', default=os.environ.get('API_HOST', '0.0.0.0'))
+    parser.add_argument('--port', type=int, default=int(os.environ.get('API_PORT', 5000)))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('API_WORKERS', 2)),
+                        help="worker 进程数，每个进程各自维护到所有集群的连接")
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('API_THREADS', 16)),
+                        help="每个 worker 的线程数，即可同时处理的请求数（含日志流）")
+    parser.add_argument('--timeout', type=int, default=int(os.environ.get('API_TIMEOUT', 120)),
+                        help="worker 无响应多久后被重启（秒）")
+    args = parser.parse_args()
 
+    if args.production:
+        run_production(f"{args.host}:{args.port}", args.workers, args.threads, args.timeout)
+    else:
+        run_dev(args.host, args.port)